@@ -7,9 +7,7 @@ from flask import Blueprint, request, redirect, url_for, flash, jsonify, current
 from flask_login import login_required
 from werkzeug.utils import secure_filename
 
-# Import necessary functions from other modules (adjust paths if needed)
-import sys
-sys.path.append('.') # Add project root to path
+# Import necessary functions from other modules
 from process_cv.cv_processor import extract_cv_text, summarize_cv
 from utils.decorators import admin_required
 
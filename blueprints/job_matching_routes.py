@@ -12,13 +12,10 @@ from flask import (
 from flask_login import login_required
 from werkzeug.utils import secure_filename
 
-# Add project root to path to find modules
-import sys
-sys.path.append('.')
-
 # Import necessary functions from other modules
 from job_matcher import match_jobs_with_cv, generate_report
 from utils.decorators import admin_required
+from utils.file_utils import read_json, sanitize_filename
 
 # Set up logging using centralized configuration
 from utils.logging_config import get_logger
@@ -199,9 +196,6 @@ def run_combined_process():
         def run_combined_process_task(app, op_id, cv_full_path_task, cv_path_rel_task, search_term_task, max_pages_task, max_jobs_task):
             with app.app_context(): # Establish app context for the thread
                 try:
-                    # Access operation status via app extensions now that context exists
-                    operation_status_ctx = app.extensions['operation_status']
-
                     # Update status (use op_id passed to function)
                     update_operation_progress(op_id, 5, 'processing', 'Updating settings...')
 
@@ -372,14 +366,13 @@ def run_combined_process():
                     report_file_path = generate_report(matches)
                     report_filename = os.path.basename(report_file_path)
 
+                    # Store the report file in the operation status for retrieval (if needed elsewhere)
+                    app.extensions['set_operation_field'](op_id, 'report_file', report_filename)
+
                     # Complete the operation
                     complete_operation(op_id, 'completed', 
                         f'Combined process completed. {len(matches)} matches available in database. File report: {report_filename}')
 
-                    # Store the report file in the operation status for retrieval (if needed elsewhere)
-                    if op_id in operation_status_ctx:
-                        operation_status_ctx[op_id]['report_file'] = report_filename
-
                 except Exception as e:
                     logger.error(f'Error in combined process task: {str(e)}', exc_info=True)
                     complete_operation(op_id, 'failed', f'Error running combined process: {str(e)}')
@@ -486,15 +479,6 @@ def view_results(report_file):
             # Import URLNormalizer for centralized URL handling
             from utils.url_utils import URLNormalizer
             
-            # Define sanitize_filename helper here or move to a shared utils module
-            def sanitize_filename(name, length=30):
-                # Allow alphanumeric, space, underscore, hyphen. Replace others with underscore.
-                sanitized = ''.join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in name)
-                # Replace spaces with underscores
-                sanitized = sanitized.replace(' ', '_')
-                # Limit length
-                return sanitized[:length]
-
             # Clean and normalize match URL using URLNormalizer
             match_app_url = URLNormalizer.clean_malformed_url(match_app_url)
             norm_match_url = URLNormalizer.normalize_for_comparison(match_app_url)
@@ -538,8 +522,7 @@ def view_results(report_file):
                                 match['motivation_letter_json_path'] = str(json_file_check.relative_to(current_app.root_path)) # Store JSON path
                                 # Check for email text in the found JSON
                                 try:
-                                    with open(json_file_check, 'r', encoding='utf-8') as f_json:
-                                        letter_data = json.load(f_json)
+                                    letter_data = read_json(json_file_check)
                                     if letter_data.get('email_text'):
                                         match['has_email_text'] = True
                                 except Exception as e_json_load:
@@ -665,7 +648,7 @@ def view_all_matches():
         - per_page: Results per page (default 50)
     """
     import math
-    from utils.db_utils import JobMatchDatabase
+    from utils.db_utils import get_thread_database
     
     # Extract filter parameters
     filters = {
@@ -684,9 +667,8 @@ def view_all_matches():
     offset = (page - 1) * per_page
     
     # Query database
-    db = JobMatchDatabase()
+    db = get_thread_database() # This thread's long-lived connection; not closed here
     try:
-        db.connect()
         
         # Build WHERE clause
         where_clauses = []
@@ -821,9 +803,6 @@ def view_all_matches():
         logger.error(f"Error in view_all_matches: {e}", exc_info=True)
         flash(f'Error loading job matches: {str(e)}')
         return redirect(url_for('index'))
-    
-    finally:
-        db.close()
 
 
 def check_for_generated_files(job_url):
@@ -917,8 +896,7 @@ def check_for_generated_files(job_url):
                     result['motivation_letter_json_path'] = str(json_file.relative_to(current_app.root_path))
                     # Check for email text in JSON
                     try:
-                        with open(json_file, 'r', encoding='utf-8') as f_json:
-                            letter_data = json.load(f_json)
+                        letter_data = read_json(json_file)
                         if letter_data.get('email_text') or email_file.is_file():
                             result['has_email_text'] = True
                             logger.info("Found email text")
@@ -942,13 +920,6 @@ def check_for_generated_files(job_url):
     return result
 
 
-def sanitize_filename(name, length=30):
-    """Sanitize filename by removing invalid characters"""
-    sanitized = ''.join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in name)
-    sanitized = sanitized.replace(' ', '_')
-    return sanitized[:length]
-
-
 def get_score_class(score):
     """Return CSS class based on score"""
     if score >= 8:
@@ -963,15 +934,14 @@ def get_score_class(score):
 @login_required
 def api_job_reasoning():
     """API endpoint to get job reasoning from database"""
-    from utils.db_utils import JobMatchDatabase
+    from utils.db_utils import get_thread_database
     
     job_url = request.args.get('url')
     if not job_url:
         return jsonify({'success': False, 'error': 'Job URL is required'}), 400
     
-    db = JobMatchDatabase()
+    db = get_thread_database() # This thread's long-lived connection; not closed here
     try:
-        db.connect()
         assert db.conn is not None, "Database connection not established"
         cursor = db.conn.cursor()
         
@@ -997,9 +967,6 @@ def api_job_reasoning():
     except Exception as e:
         logger.error(f"Error fetching job reasoning: {e}", exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
-    
-    finally:
-        db.close()
 
 
 @job_matching_bp.route('/api/job-matches', methods=['GET'])
@@ -1055,7 +1022,7 @@ def api_job_matches():
 def kanban_board():
     """Display Kanban board view of job applications."""
     from utils.cv_utils import get_cv_versions
-    from utils.db_utils import JobMatchDatabase
+    from utils.db_utils import get_thread_database
     
     # Get CV versions for filter
     cv_versions = get_cv_versions()
@@ -1063,9 +1030,7 @@ def kanban_board():
     # FALLBACK: If no CV versions registered, get cv_keys directly from job_matches
     if not cv_versions:
         logger.warning("No CV versions found in cv_versions table, using cv_keys from job_matches")
-        db = JobMatchDatabase()
-        db.connect()
-        cursor = db.conn.cursor()
+        cursor = get_thread_database().conn.cursor()
         cursor.execute("""
             SELECT DISTINCT cv_key 
             FROM job_matches 
@@ -1073,7 +1038,6 @@ def kanban_board():
             ORDER BY cv_key
         """)
         cv_keys = cursor.fetchall()
-        db.close()
         
         # Convert to same format as get_cv_versions: [(cv_key, display_name, date)]
         cv_versions = [(row[0], f"CV {row[0][:8]}...", None) for row in cv_keys]
@@ -1086,8 +1050,7 @@ def kanban_board():
         selected_cv = cv_versions[0][0]  # Default to first CV
     
     # Fetch all jobs with status
-    db = JobMatchDatabase()
-    db.connect()
+    db = get_thread_database() # This thread's long-lived connection; not closed here
     
     query = '''
         SELECT 
@@ -1113,7 +1076,6 @@ def kanban_board():
     cursor = db.conn.cursor()
     cursor.execute(query, (selected_cv,))
     results = cursor.fetchall()
-    db.close()
     
     # Group jobs by status
     pipeline = {
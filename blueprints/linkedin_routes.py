@@ -1,10 +1,10 @@
 import json
-from pathlib import Path
 from flask import Blueprint, request, jsonify, current_app
 from flask_login import login_required
 from services.linkedin_generator import generate_linkedin_messages
 from job_details_utils import get_job_details
 from utils.decorators import admin_required
+from utils.cv_utils import get_cv_summary_path, load_cv_summary
 
 # Set up logging using centralized configuration
 from utils.logging_config import get_logger
@@ -53,14 +53,13 @@ def generate_messages():
             return jsonify({'success': False, 'error': 'Could not fetch job details'}), 404
 
         # 2. Get CV Summary
-        summary_path = Path(current_app.root_path) / 'process_cv/cv-data/processed' / f"{cv_filename}_summary.txt"
+        summary_path = get_cv_summary_path(current_app.root_path, cv_filename)
         if not summary_path.exists():
             logger.warning(f"CV summary not found at path: {summary_path}")
             return jsonify({'success': False, 'error': f'CV summary not found: {summary_path}'}), 404
 
         logger.info(f"Reading CV summary from: {summary_path}")
-        with open(summary_path, 'r', encoding='utf-8') as f:
-            cv_summary = f.read()
+        cv_summary = load_cv_summary(summary_path)
 
         # 3. Generate Messages
         messages = generate_linkedin_messages(cv_summary, job_details)
@@ -1,28 +1,32 @@
 import os
 import json
+import functools
+import hashlib
 import threading
-import urllib.parse
-import traceback
+import multiprocessing
+from concurrent.futures import (
+    ProcessPoolExecutor, as_completed,
+    TimeoutError as FuturesTimeoutError
+)
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from flask import (
     Blueprint, request, redirect, url_for, flash, send_file, jsonify,
-    render_template, current_app
+    render_template, current_app, session, make_response
 )
-from flask_login import login_required
-from werkzeug.utils import secure_filename
-
-# Add project root to path
-import sys
-sys.path.append('.')
+from flask_login import login_required, current_user
 
 # Import necessary functions from other modules
-from word_template_generator import json_to_docx, create_word_document_from_json_file
+from word_template_generator import json_to_docx
 # Import functions needed for manual text structuring and generation
-from job_details_utils import structure_text_with_openai, has_sufficient_content, get_job_details
+from job_details_utils import structure_text_with_openai, has_sufficient_content, has_minimal_content, get_job_details
 from letter_generation_utils import generate_motivation_letter, generate_email_text_only # Import the correct generator functions
 from utils.decorators import admin_required
-from services.application_service import update_application_status, get_application_status
-from utils.db_utils import JobMatchDatabase
+from utils.db_utils import get_thread_database
+from utils.cv_utils import get_cv_summary_path, load_cv_summary
+from utils.file_utils import read_json, save_json_file, find_latest_cv_pdf, sanitize_filename
+from utils.url_utils import URLNormalizer
+from config import config
 
 # Set up logging using centralized configuration
 from utils.logging_config import get_logger
@@ -43,11 +47,266 @@ def get_job_details_for_url(job_url):
         logger.error("get_job_details_for_url function not found on current_app context!")
         return {} # Return empty dict or raise an error
 
-# Helper function to sanitize filenames (consider moving to utils)
-def sanitize_filename(name, length=30):
-    sanitized = ''.join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in name)
-    sanitized = sanitized.replace(' ', '_')
-    return sanitized[:length]
+# Directory (relative to the app root) holding generated letters, emails and DOCX files
+LETTERS_DIR = 'motivation_letters'
+
+@functools.lru_cache(maxsize=None)
+def letters_dir_for(root_path):
+    """Return the absolute letters directory for an app root; built once per root."""
+    return Path(root_path) / LETTERS_DIR
+
+# Upper bound on how long a bulk request waits for its workers before answering
+BULK_TIMEOUT_SECONDS = config.get_default('letter_generation', 'bulk_timeout_seconds', 600)
+# DOCX rendering is CPU-bound template/XML work, so it runs in worker processes instead of
+# competing for the GIL with the request and LLM threads
+DOCX_PROCESS_WORKERS = config.get_default('letter_generation', 'docx_processes', 2)
+# Bulk requests with more job URLs than this are rejected before any work is queued
+MAX_BULK_JOBS = config.get_default('letter_generation', 'max_bulk_jobs', 200)
+
+@functools.lru_cache(maxsize=128)
+def _read_letter_html(path_str, mtime_ns, size):
+    """Read a letter HTML file; cached per (path, mtime, size) so regenerated letters are re-read."""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def load_letter_html(html_path):
+    """Return the HTML of a generated letter, served from memory while the file is unchanged."""
+    html_path = str(html_path)
+    st = os.stat(html_path)
+    return _read_letter_html(html_path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=256)
+def _read_letter_json(path_str, mtime_ns, size):
+    """Parse a letter JSON file; cached per (path, mtime, size) so rewrites invalidate the entry.
+
+    The size guards against rewrites within the filesystem's timestamp granularity.
+    """
+    return read_json(path_str)
+
+def load_letter_json(json_path):
+    """Return the parsed letter JSON, served from memory while the file is unchanged.
+
+    The returned dict is shared between callers: treat it as read-only.
+    """
+    json_path = str(json_path)
+    st = os.stat(json_path)
+    return _read_letter_json(json_path, st.st_mtime_ns, st.st_size)
+
+# Fixed set of lock stripes for letter JSON paths, so read-modify-write updates of the same
+# file (e.g. two selected jobs with the same title) don't overwrite each other's changes.
+# Paths share a stripe by hash; the set never grows, unlike one lock per path.
+LETTER_JSON_LOCK_STRIPES = 64
+_letter_json_locks = tuple(threading.Lock() for _ in range(LETTER_JSON_LOCK_STRIPES))
+
+def letter_json_lock(json_path):
+    """Return the process-wide lock serializing updates to json_path."""
+    return _letter_json_locks[hash(os.path.abspath(json_path)) % LETTER_JSON_LOCK_STRIPES]
+
+def redirect_back(report_file=None):
+    """Redirect to the job match results for report_file, or to the dashboard without one."""
+    if report_file:
+        return redirect(url_for('job_matching.view_results', report_file=report_file))
+    return redirect(url_for('index'))
+
+def lookup_job_title(job_url):
+    """Return the job title stored for job_url in the job_matches table, or None."""
+    try:
+        return get_thread_database().get_job_title(job_url)
+    except Exception as e:
+        logger.warning(f"Job title lookup failed for {job_url}: {e}")
+        return None
+
+# Directory (relative to the app root) holding the per-application checkpoint folders
+APPLICATIONS_DIR = 'applications'
+
+def comparable_job_url(job_url):
+    """Return job_url in the form used to match it against stored application URLs."""
+    return URLNormalizer.normalize_for_comparison(
+        URLNormalizer.to_full_url(URLNormalizer.clean_malformed_url(job_url))
+    )
+
+def generated_letter_urls(applications_dir):
+    """Return the comparable job URLs of application folders that already hold a letter.
+
+    A folder counts once generate_motivation_letter has written its letter HTML and
+    application-data.json; the job URL is read from the folder's job-details.json.
+    One directory listing covers all jobs of a bulk request.
+    """
+    urls = set()
+    try:
+        with os.scandir(applications_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if not (os.path.isfile(os.path.join(entry.path, 'bewerbungsschreiben.html'))
+                        and os.path.isfile(os.path.join(entry.path, 'application-data.json'))):
+                    continue
+                try:
+                    stored_url = read_json(os.path.join(entry.path, 'job-details.json')).get('Application URL')
+                except Exception as e:
+                    logger.debug(f"No readable job details in {entry.path}: {e}")
+                    continue
+                if isinstance(stored_url, str) and stored_url and stored_url != 'N/A':
+                    urls.add(comparable_job_url(stored_url))
+    except FileNotFoundError:
+        return set()
+    return urls
+
+def promote_generated_letters(job_urls, cv_key):
+    """Move the applications of jobs whose letter HTML and JSON were just written to PREPARING.
+
+    Shared by the single and bulk routes; a failed status update is logged and never fails
+    the generation itself. Returns the number of application rows written.
+    """
+    try:
+        # One INSERT ... SELECT ... ON CONFLICT statement per job resolves the job match,
+        # checks the current status and writes the new one
+        promoted = get_thread_database().promote_application_statuses(job_urls, cv_key, 'PREPARING')
+        logger.info(f"Auto-transitioned {promoted} of {len(job_urls)} job(s) (CV: {cv_key}) to PREPARING after letter generation")
+        return promoted
+    except Exception as e:
+        logger.exception(f"Error during auto-transition on letter generation: {str(e)}")
+        return 0
+
+def is_fetchable_job_url(job_url):
+    """True for URLs a worker can fetch; empty values and placeholders such as 'N/A' are not."""
+    return isinstance(job_url, str) and job_url.startswith('http')
+
+def to_app_path(path, app_root):
+    """Return path as an absolute path string, resolving relative paths against app_root."""
+    path = os.fspath(path)
+    return path if os.path.isabs(path) else os.path.join(app_root, path)
+
+def letter_docx_path(json_path, app_root):
+    """Return the absolute path of the DOCX that sits next to a letter JSON."""
+    return os.path.splitext(to_app_path(json_path, app_root))[0] + '.docx'
+
+def to_app_relative(path, app_root):
+    """Return path relative to app_root as a string, without building Path objects.
+
+    Relative paths are already app-relative and are only normalized. Like
+    Path.relative_to(), raises ValueError for an absolute path outside app_root.
+    """
+    path = os.path.normpath(path)
+    if not os.path.isabs(path):
+        return path
+    root = os.path.normpath(app_root)
+    if not path.startswith(root + os.sep):
+        raise ValueError(f"{path} is not inside {root}")
+    return path[len(root) + 1:]
+
+_docx_pool = None
+_docx_pool_lock = threading.Lock()
+# Absolute DOCX path -> Future of a render that hasn't finished yet. Letters are reported
+# as soon as their JSON/HTML exist; the download routes wait here for a DOCX still in flight.
+_pending_docx = {}
+# How long a download waits for an in-flight DOCX before falling back to rendering it itself
+DOCX_DOWNLOAD_WAIT_SECONDS = 30
+
+def get_docx_pool(broken_pool=None):
+    """Return the shared DOCX process pool, starting it on demand.
+
+    broken_pool: A pool the caller saw raise BrokenProcessPool. It is shut down and replaced
+    only while it is still the shared pool, so threads hitting the same breakage start one
+    new pool between them and none is leaked.
+    """
+    global _docx_pool
+    with _docx_pool_lock:
+        if broken_pool is not None and _docx_pool is broken_pool:
+            broken_pool.shutdown(wait=False, cancel_futures=True)
+            _docx_pool = None
+        if _docx_pool is None:
+            # 'spawn' so the children don't inherit the web server's threads and held locks
+            _docx_pool = ProcessPoolExecutor(max_workers=DOCX_PROCESS_WORKERS,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return _docx_pool
+
+def _log_docx_result(job_url, future):
+    """Done-callback for submit_letter_docx: log the outcome of one DOCX render."""
+    try:
+        generated_path = future.result()
+        if generated_path:
+            logger.info(f"Generated Word document: {generated_path} for URL: {job_url}")
+        else:
+            logger.warning(f"Failed to generate Word document (json_to_docx returned None) for URL: {job_url}")
+    except Exception as docx_e:
+        logger.error(f"Exception generating Word document for URL {job_url}: {str(docx_e)}")
+
+def _forget_pending_docx(docx_key, future):
+    """Done-callback for submit_letter_docx: drop the finished render from _pending_docx."""
+    with _docx_pool_lock:
+        if _pending_docx.get(docx_key) is future:
+            del _pending_docx[docx_key]
+
+def submit_letter_docx(letter_json, docx_path, job_url):
+    """Render the letter JSON to docx_path in the DOCX process pool; returns the Future."""
+    pool = get_docx_pool()
+    try:
+        future = pool.submit(json_to_docx, letter_json, output_path=str(docx_path))
+    except BrokenProcessPool:
+        # A crashed child breaks the whole pool; start a fresh one and retry once
+        logger.warning("DOCX process pool was broken, restarting it")
+        future = get_docx_pool(broken_pool=pool).submit(json_to_docx, letter_json, output_path=str(docx_path))
+    docx_key = os.path.abspath(docx_path)
+    with _docx_pool_lock:
+        _pending_docx[docx_key] = future
+    future.add_done_callback(functools.partial(_log_docx_result, job_url))
+    future.add_done_callback(functools.partial(_forget_pending_docx, docx_key))
+    return future
+
+def wait_for_pending_docx(docx_path, timeout=DOCX_DOWNLOAD_WAIT_SECONDS):
+    """Block until a background render of docx_path (if any) has finished or timeout passes."""
+    with _docx_pool_lock:
+        future = _pending_docx.get(os.path.abspath(docx_path))
+    if future is None:
+        return
+    try:
+        future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        logger.warning(f"DOCX render for {docx_path} still running after {timeout}s")
+    except Exception as e:
+        logger.warning(f"Background DOCX render for {docx_path} failed: {e}")
+
+def send_letter_file(path):
+    """
+    Send a generated letter file as a download that browsers can revalidate.
+
+    Letters are regenerated under the same name, so instead of a long max-age the
+    client gets an ETag/Last-Modified pair and a repeat download is answered with
+    304 Not Modified. 'private' keeps shared proxies from caching personal letters.
+    """
+    response = send_file(str(path), as_attachment=True, conditional=True, etag=True, max_age=0)
+    response.cache_control.private = True
+    return response
+
+def file_view_etag(path):
+    """
+    ETag for a page rendered from a single file: changes when the file, the query
+    string or the logged-in user changes.
+    """
+    st = os.stat(path)
+    raw = f"{st.st_mtime_ns}-{st.st_size}-{request.full_path}-{current_user.get_id()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def is_not_modified(etag):
+    """True when the client already holds this version and no flash message is waiting to be shown."""
+    return '_flashes' not in session and etag in request.if_none_match
+
+def render_file_view(etag, template_name, **context):
+    """Render a file-backed page with a private, revalidatable ETag."""
+    response = make_response(render_template(template_name, **context))
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+def not_modified_response(etag):
+    """Empty 304 answer for a client whose cached page is still current."""
+    response = make_response('', 304)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 @motivation_letter_bp.route('/generate', methods=['POST'])
 @login_required
@@ -60,6 +319,7 @@ def generate_motivation_letter_route():
         job_url = request.form.get('job_url')
         report_file = request.form.get('report_file') # To redirect back to the correct results page
         manual_job_text = request.form.get('manual_job_text') # Get manual text if provided
+        force_regenerate = request.form.get('force') == '1' # Bypass the stored OpenAI results
 
         log_msg = f"Generating motivation letter for CV: {cv_filename}, job URL: {job_url}"
         if manual_job_text:
@@ -70,64 +330,34 @@ def generate_motivation_letter_route():
             logger.error(f"Missing CV filename or job URL: cv_filename={cv_filename}, job_url={job_url}")
             return jsonify({'success': False, 'error': 'Missing CV filename or job URL'}), 400
 
-        # Check if the CV summary file exists (relative to app root)
-        summary_path = Path(current_app.root_path) / 'process_cv/cv-data/processed' / f"{cv_filename}_summary.txt"
-        if not summary_path.exists():
+        # Read the CV summary once here (relative to app root); the task gets the text, not the path
+        summary_path = get_cv_summary_path(current_app.root_path, cv_filename)
+        try:
+            cv_summary_text = load_cv_summary(summary_path)
+        except FileNotFoundError:
             logger.error(f"CV summary file not found: {summary_path}")
             return jsonify({'success': False, 'error': f'CV summary file not found: {summary_path.name}'}), 400
+        except Exception as cv_load_err:
+            logger.error(f"Error reading CV summary file {summary_path}: {cv_load_err}", exc_info=True)
+            return jsonify({'success': False, 'error': f'Error reading CV summary: {cv_load_err}'}), 500
+        if not cv_summary_text:
+            logger.error(f"CV summary file is empty: {summary_path}")
+            return jsonify({'success': False, 'error': f'CV summary file is empty: {summary_path.name}'}), 400
         
-        # --- Auto-transition status to PREPARING on letter generation ---
-        try:
-            from utils.url_utils import URLNormalizer
-            normalizer = URLNormalizer()
-            normalized_url = normalizer.normalize(job_url)
-            
-            # Get CV key from filename (remove _summary.txt)
-            cv_key = cv_filename
-            
-            # Find the job match
-            db = JobMatchDatabase()
-            db.create_connection()
-            cursor = db.conn.cursor()
-            
-            cursor.execute('''
-                SELECT id FROM job_matches 
-                WHERE job_url = ? AND cv_key = ?
-            ''', (normalized_url, cv_key))
-            
-            result = cursor.fetchone()
-            db.close_connection()
-            
-            if result:
-                job_match_id = result[0]
-                
-                # Check current status
-                current_status = get_application_status(job_match_id)
-                
-                # Only update if in early stages (MATCHED or INTERESTED)
-                if current_status in ['MATCHED', 'INTERESTED']:
-                    success = update_application_status(job_match_id, 'PREPARING')
-                    if success:
-                        logger.info(f"Auto-transitioned job {job_match_id} to PREPARING on letter generation")
-                    else:
-                        logger.warning(f"Failed to auto-transition job {job_match_id} to PREPARING")
-                else:
-                    logger.info(f"Skipped auto-transition for job {job_match_id} (current status: {current_status})")
-            else:
-                logger.warning(f"Could not find job match for auto-transition (URL: {job_url}, CV: {cv_key})")
-        except Exception as e:
-            # Don't fail letter generation if status update fails
-            logger.exception(f"Error during auto-transition on letter generation: {str(e)}")
-
         # --- Check if letter already exists --- ONLY if not using manual text input ---
+        job_details_check = None # Reused by the task so the job isn't fetched twice
         if not manual_job_text:
-            job_details_check = get_job_details(job_url) # Use the main function
+            # Matched jobs already have their title in the DB; only scrape when the URL is unknown
+            job_title = lookup_job_title(job_url)
+            if not job_title:
+                job_details_check = get_job_details(job_url, refresh=force_regenerate) # Use the main function
+                if job_details_check and 'Job Title' in job_details_check:
+                    job_title = job_details_check['Job Title']
             existing_letter_found = False
 
-            if job_details_check and 'Job Title' in job_details_check:
-                job_title = job_details_check['Job Title']
+            if job_title:
                 sanitized_job_title = sanitize_filename(job_title)
-                letters_dir = Path(current_app.root_path) / 'motivation_letters'
+                letters_dir = letters_dir_for(current_app.root_path)
                 html_path = letters_dir / f"motivation_letter_{sanitized_job_title}.html"
                 json_path = letters_dir / f"motivation_letter_{sanitized_job_title}.json"
 
@@ -143,71 +373,67 @@ def generate_motivation_letter_route():
         start_operation = current_app.extensions['start_operation']
         update_operation_progress = current_app.extensions['update_operation_progress']
         complete_operation = current_app.extensions['complete_operation']
-        operation_status = current_app.extensions['operation_status']
+        set_operation_field = current_app.extensions['set_operation_field']
         app_instance = current_app._get_current_object() # Get app instance for context
 
         operation_id = start_operation('motivation_letter_generation')
 
         # Define background task function (takes app context and manual_job_text)
-        def generate_motivation_letter_task(app, op_id, cv_name, job_url_task, report_file_task, manual_job_text_task):
+        def generate_motivation_letter_task(app, op_id, cv_name, cv_summary_text, job_url_task, report_file_task, manual_job_text_task, force_task, prefetched_job_details):
+            def fail(message, log_message=None, exc_info=False):
+                """Log why the task stops and mark the operation failed; callers return right after."""
+                logger.error(log_message or message, exc_info=exc_info)
+                complete_operation(op_id, 'failed', message)
+
             with app.app_context(): # Establish app context for the thread
                 job_details = None
-                cv_summary_text = None # Initialize variable for CV summary content
                 try:
-                    # --- Load CV Summary ---
-                    summary_path_task = Path(app.root_path) / 'process_cv/cv-data/processed' / f"{cv_name}_summary.txt"
-                    if not summary_path_task.is_file():
-                         logger.error(f"CV summary file not found inside task: {summary_path_task}")
-                         complete_operation(op_id, 'failed', f'CV summary file not found: {cv_name}_summary.txt')
-                         return
-                    try:
-                        with open(summary_path_task, 'r', encoding='utf-8') as f_cv:
-                            cv_summary_text = f_cv.read()
-                        if not cv_summary_text:
-                             raise ValueError("CV summary file is empty.")
-                        logger.info(f"Successfully loaded CV summary for {cv_name}")
-                    except Exception as cv_load_err:
-                         logger.error(f"Error reading CV summary file {summary_path_task}: {cv_load_err}", exc_info=True)
-                         complete_operation(op_id, 'failed', f'Error reading CV summary: {cv_load_err}')
-                         return
+                    app_root = Path(app.root_path) # Resolved once, reused for every path below
+                    # CV summary text was read by the route before the task was submitted
 
                     # --- Step 1: Get or Structure Job Details ---
                     if manual_job_text_task:
                         update_operation_progress(op_id, 10, 'processing', 'Structuring manual text...')
                         logger.info(f"Structuring manually provided text for job URL: {job_url_task}")
-                        job_details = structure_text_with_openai(manual_job_text_task, job_url_task, source_type="Manual Input")
+                        job_details = structure_text_with_openai(manual_job_text_task, job_url_task, source_type="Manual Input", refresh=force_task)
 
                         if not job_details:
-                            logger.error("Failed to structure manually provided text.")
-                            complete_operation(op_id, 'failed', 'Failed to structure manually provided text.')
-                            return
+                            return fail('Failed to structure manually provided text.')
                         if not has_sufficient_content(job_details):
+                             # Borderline input still gets a letter; near-empty input is rejected before the LLM call
+                             if not has_minimal_content(job_details):
+                                 return fail('Insufficient job content in the provided text.', "Manually provided text is too short to generate a letter from.")
                              logger.warning("Manually provided text structured, but content might be insufficient.")
                              update_operation_progress(op_id, 20, 'processing', 'Manual text structured (warning: content may be insufficient). Generating letter...')
                         else:
                              update_operation_progress(op_id, 20, 'processing', 'Manual text structured successfully. Generating letter...')
                     else:
-                        update_operation_progress(op_id, 10, 'processing', 'Fetching/Scraping job details...')
-                        logger.info(f"Attempting automatic job detail fetching for URL: {job_url_task}")
-                        job_details = get_job_details(job_url_task)
+                        if prefetched_job_details:
+                            # Already fetched by the route's existing-letter check
+                            job_details = prefetched_job_details
+                        else:
+                            update_operation_progress(op_id, 10, 'processing', 'Fetching/Scraping job details...')
+                            logger.info(f"Attempting automatic job detail fetching for URL: {job_url_task}")
+                            job_details = get_job_details(job_url_task, refresh=force_task)
 
                         if not job_details or not has_sufficient_content(job_details):
-                             logger.error(f"Failed to fetch sufficient job details automatically for {job_url_task}.")
-                             complete_operation(op_id, 'failed', 'Failed to fetch sufficient job details automatically.')
-                             return
+                             return fail('Failed to fetch sufficient job details automatically.', f"Failed to fetch sufficient job details automatically for {job_url_task}.")
                         update_operation_progress(op_id, 20, 'processing', 'Job details fetched successfully. Generating letter...')
 
                     # --- Step 2: Generate Letter using job_details and cv_summary_text ---
                     logger.info(f"Calling letter_generation_utils.generate_motivation_letter for CV '{cv_name}'")
-                    result = generate_motivation_letter(cv_summary_text, job_details) # Pass the actual summary text
+                    result = generate_motivation_letter(
+                        cv_summary_text, job_details, refresh=force_task, # Pass the actual summary text
+                        render_docx=lambda letter_json, docx_path: submit_letter_docx(letter_json, docx_path, job_url_task)
+                    )
 
                     if not result:
-                        logger.error("Failed to generate motivation letter (letter_generation_utils.generate_motivation_letter returned None)")
-                        complete_operation(op_id, 'failed', 'Failed to generate motivation letter')
-                        return
+                        return fail('Failed to generate motivation letter', "Failed to generate motivation letter (letter_generation_utils.generate_motivation_letter returned None)")
 
                     update_operation_progress(op_id, 70, 'processing', 'Formatting motivation letter...')
                     logger.info(f"Successfully generated motivation letter content")
+                    # --- Auto-transition status to PREPARING now that the letter is written ---
+                    promote_generated_letters([job_url_task], cv_name)
 
                     has_json = 'motivation_letter_json' in result and 'json_file_path' in result
                     docx_file_path_rel = None
@@ -215,20 +441,13 @@ def generate_motivation_letter_route():
                     if has_json:
                         json_file_path_abs_str = result['json_file_path']
                         logger.info(f"Generated JSON motivation letter: {json_file_path_abs_str}")
-                        update_operation_progress(op_id, 80, 'processing', 'Creating Word document...')
                         try:
-                            abs_json_path = Path(json_file_path_abs_str)
-                            if not abs_json_path.is_absolute():
-                                abs_json_path = Path(app.root_path) / json_file_path_abs_str
-                            abs_docx_path = abs_json_path.with_suffix('.docx')
-                            docx_path_abs = json_to_docx(result['motivation_letter_json'], output_path=str(abs_docx_path))
-                            if docx_path_abs:
-                                 docx_file_path_rel = str(Path(docx_path_abs).relative_to(app.root_path))
-                                 logger.info(f"Generated Word document: {docx_path_abs}")
-                            else:
-                                 logger.warning(f"json_to_docx returned None for {abs_json_path}")
+                            # Rendered in the background; the download routes wait for it if it's still running
+                            docx_file_path_abs = letter_docx_path(json_file_path_abs_str, app_root)
+                            submit_letter_docx(result['motivation_letter_json'], docx_file_path_abs, job_url_task)
+                            docx_file_path_rel = to_app_relative(docx_file_path_abs, app_root)
                         except Exception as docx_e:
-                             logger.error(f"Error generating DOCX from JSON {abs_json_path}: {docx_e}", exc_info=True)
+                             logger.error(f"Error starting DOCX generation for {json_file_path_abs_str}: {docx_e}", exc_info=True)
                     else:
                         logger.info(f"Generated HTML motivation letter: {result.get('file_path', 'N/A')}")
 
@@ -237,14 +456,10 @@ def generate_motivation_letter_route():
                     html_file_path_abs_str = result.get('html_file_path') if has_json else result.get('file_path')
                     html_file_path_rel = None
                     if html_file_path_abs_str:
-                         abs_html_path = Path(html_file_path_abs_str)
-                         if not abs_html_path.is_absolute():
-                              abs_html_path = Path(app.root_path) / html_file_path_abs_str
-                         html_file_path_rel = str(abs_html_path.relative_to(app.root_path))
-
-                    complete_operation(op_id, 'completed', 'Motivation letter generated successfully')
+                         html_file_path_rel = to_app_relative(html_file_path_abs_str, app_root)
 
-                    operation_status[op_id]['result'] = {
+                    # Store the result before completing so pollers never see 'completed' without it
+                    set_operation_field(op_id, 'result', {
                         'has_json': has_json,
                         'motivation_letter_content': result.get('motivation_letter_html'),
                         'html_file_path': html_file_path_rel,
@@ -252,15 +467,14 @@ def generate_motivation_letter_route():
                         'docx_file_path': docx_file_path_rel,
                         'job_details': job_details,
                         'report_file': report_file_task
-                    }
+                    })
+                    complete_operation(op_id, 'completed', 'Motivation letter generated successfully')
                 except Exception as e:
-                    logger.error(f'Error in motivation letter generation task: {str(e)}', exc_info=True)
-                    complete_operation(op_id, 'failed', f'Error generating motivation letter: {str(e)}')
+                    fail(f'Error generating motivation letter: {str(e)}', f'Error in motivation letter generation task: {str(e)}', exc_info=True)
 
-        thread_args = (app_instance, operation_id, cv_filename, job_url, report_file, manual_job_text)
-        thread = threading.Thread(target=generate_motivation_letter_task, args=thread_args)
-        thread.daemon = True
-        thread.start()
+        # Run on the app-wide letter pool so bursts of requests queue instead of each spawning a thread
+        task_args = (app_instance, operation_id, cv_filename, cv_summary_text, job_url, report_file, manual_job_text, force_regenerate, job_details_check)
+        current_app.extensions['letter_executor'].submit(generate_motivation_letter_task, *task_args)
 
         return jsonify({'success': True, 'operation_id': operation_id})
 
@@ -274,96 +488,131 @@ def generate_motivation_letter_route():
 @admin_required
 def generate_multiple_letters():
     """Generate motivation letters for multiple selected jobs"""
-    data = request.get_json()
+    data = request.get_json(silent=True) # Malformed JSON gets the 400 below instead of an HTML error page
     if not data:
         logger.error("Invalid request format for /generate_multiple_letters")
         return jsonify({'error': 'Invalid request format'}), 400
 
     job_urls = data.get('job_urls')
     cv_base_name = data.get('cv_filename')
+    force_regenerate = bool(data.get('force')) # Regenerate existing letters, bypassing the caches
 
     if not job_urls or not isinstance(job_urls, list) or not cv_base_name:
         logger.error(f"Missing job_urls or cv_filename in request: {data}")
         return jsonify({'error': 'Missing job_urls or cv_filename'}), 400
+    if len(job_urls) > MAX_BULK_JOBS:
+        logger.error(f"Rejected bulk letter request for {len(job_urls)} jobs (limit {MAX_BULK_JOBS})")
+        return jsonify({'error': f'Too many jobs selected ({len(job_urls)}); the limit is {MAX_BULK_JOBS} per request'}), 413
 
     logger.info(f"Received request to generate {len(job_urls)} letters for CV: {cv_base_name}")
 
     # Check if the corresponding CV summary exists
-    summary_path = Path(current_app.root_path) / 'process_cv/cv-data/processed' / f"{cv_base_name}_summary.txt"
+    summary_path = get_cv_summary_path(current_app.root_path, cv_base_name)
     if not summary_path.exists():
         logger.error(f"Required CV summary file not found: {summary_path}")
         return jsonify({'error': f'Required CV summary file not found for {cv_base_name}'}), 400
 
-    results = {'success_count': 0, 'errors': []}
-    threads = []
-    lock = threading.Lock()
+    results = {'success_count': 0, 'errors': [], 'skipped': []}
+    generated_urls = [] # Promoted to PREPARING in one batch once all workers finish
     app_instance = current_app._get_current_object()
+    app_root = Path(app_instance.root_path) # Resolved once per request, shared by all workers
+
+    job_urls = list(dict.fromkeys(job_urls))
+    # Invalid URLs are reported straight away instead of occupying a worker
+    for url in job_urls:
+        if not is_fetchable_job_url(url):
+            logger.warning(f"Skipping invalid job URL: {url}")
+            results['errors'].append(url)
+    job_urls = [url for url in job_urls if is_fetchable_job_url(url)]
+    # Unless forced, skip URLs that already have an application folder with a letter,
+    # so repeated bulk requests don't pay for the LLM call again
+    if not force_regenerate:
+        existing_urls = generated_letter_urls(app_root / APPLICATIONS_DIR)
+        results['skipped'] = [url for url in job_urls if comparable_job_url(url) in existing_urls]
+    if results['skipped']:
+        logger.info(f"Skipping {len(results['skipped'])} job(s) that already have a letter")
+        skipped = set(results['skipped'])
+        job_urls = [url for url in job_urls if url not in skipped]
 
     cv_summary_text = None
     try:
-        summary_path_main = Path(app_instance.root_path) / 'process_cv/cv-data/processed' / f"{cv_base_name}_summary.txt"
-        with open(summary_path_main, 'r', encoding='utf-8') as f_cv_main:
-            cv_summary_text = f_cv_main.read()
+        cv_summary_text = load_cv_summary(summary_path)
         if not cv_summary_text:
             raise ValueError("CV summary file is empty.")
         logger.info(f"Successfully loaded CV summary for {cv_base_name} for bulk generation.")
     except Exception as cv_load_err:
-        logger.error(f"Error reading CV summary file {summary_path_main} before starting threads: {cv_load_err}", exc_info=True)
+        logger.error(f"Error reading CV summary file {summary_path} before starting threads: {cv_load_err}", exc_info=True)
         return jsonify({'error': f'Error reading CV summary: {cv_load_err}'}), 500
 
-    def generate_single_letter_task(app, job_url, cv_summary_content, cv_name_for_log):
-        nonlocal results
-        with app.app_context():
-            if not job_url or job_url == 'N/A' or not job_url.startswith('http'):
-                logger.warning(f"Skipping invalid job URL: {job_url}")
-                with lock: results['errors'].append(job_url)
-                return
+    # Every letter folder gets a copy of the same CV PDF; find it once instead of per job
+    cv_pdf = find_latest_cv_pdf()
 
-            try:
-                logger.info(f"Generating letter for CV '{cv_name_for_log}' and URL '{job_url}'")
-                logger.info(f"Fetching job details for URL: {job_url}")
-                job_details = get_job_details(job_url)
-
-                if not job_details or not has_sufficient_content(job_details):
-                     logger.error(f"Failed to fetch sufficient job details for {job_url} in bulk generation.")
-                     with lock: results['errors'].append(job_url)
-                     return
-
-                logger.info(f"Calling generate_motivation_letter for CV '{cv_name_for_log}' and URL '{job_url}'")
-                result = generate_motivation_letter(cv_summary_content, job_details)
-
-                if result:
-                    logger.info(f"Generator returned result for URL: {job_url}")
-                    with lock: results['success_count'] += 1
-                    if 'motivation_letter_json' in result and 'json_file_path' in result:
-                         try:
-                             abs_json_path = Path(result['json_file_path'])
-                             if not abs_json_path.is_absolute():
-                                 abs_json_path = Path(app.root_path) / result['json_file_path']
-                             abs_docx_path = abs_json_path.with_suffix('.docx')
-                             docx_path = json_to_docx(result['motivation_letter_json'], output_path=str(abs_docx_path))
-                             if docx_path:
-                                 logger.info(f"Generated Word document: {docx_path} for URL: {job_url}")
-                             else:
-                                 logger.warning(f"Failed to generate Word document (json_to_docx returned None) for URL: {job_url}")
-                         except Exception as docx_e:
-                             logger.error(f"Exception generating Word document for URL {job_url}: {str(docx_e)}")
-                else:
-                    logger.error(f"Failed to generate letter (generate_motivation_letter returned None) for URL: {job_url}")
-                    with lock: results['errors'].append(job_url)
-            except Exception as e:
-                logger.error(f"Exception generating letter for URL {job_url}: {str(e)}", exc_info=True)
-                with lock: results['errors'].append(job_url)
+    def generate_single_letter_task(job_url, cv_summary_content, cv_name_for_log):
+        """Generate one letter; returns True on success. Results are tallied by the caller.
 
-    for url in job_urls:
-        thread = threading.Thread(target=generate_single_letter_task, args=(app_instance, url, cv_summary_text, cv_base_name))
-        threads.append(thread)
-        thread.start()
-
-    for thread in threads:
-        thread.join()
+        Runs without an app context: everything it needs from the app was resolved above.
+        """
+        try:
+            logger.info(f"Generating letter for CV '{cv_name_for_log}' and URL '{job_url}'")
+            logger.info(f"Fetching job details for URL: {job_url}")
+            # Repeat fetches of the same job are served by the job details cache
+            job_details = get_job_details(job_url, refresh=force_regenerate)
+
+            if not job_details or not has_sufficient_content(job_details):
+                 logger.error(f"Failed to fetch sufficient job details for {job_url} in bulk generation.")
+                 return False
+
+            logger.info(f"Calling generate_motivation_letter for CV '{cv_name_for_log}' and URL '{job_url}'")
+            # The application folder's DOCX goes to the process pool too, so the GIL-bound render
+            # doesn't hold up this thread's next LLM call
+            result = generate_motivation_letter(
+                cv_summary_content, job_details, cv_pdf=cv_pdf, refresh=force_regenerate,
+                render_docx=lambda letter_json, docx_path: submit_letter_docx(letter_json, docx_path, job_url)
+            )
 
-    logger.info(f"Multiple letter generation complete. Success: {results['success_count']}, Failures: {len(results['errors'])}")
+            if result:
+                logger.info(f"Generator returned result for URL: {job_url}")
+                if 'motivation_letter_json' in result and 'json_file_path' in result:
+                     # Render in the process pool so this worker can start the next URL; the
+                     # response doesn't wait for it (downloads wait if it's still running)
+                     submit_letter_docx(result['motivation_letter_json'], letter_docx_path(result['json_file_path'], app_root), job_url)
+                return True
+            logger.error(f"Failed to generate letter (generate_motivation_letter returned None) for URL: {job_url}")
+            return False
+        except Exception as e:
+            logger.error(f"Exception generating letter for URL {job_url}: {str(e)}", exc_info=True)
+            return False
+
+    # App-wide bounded pool: each worker holds an OpenAI/scraper connection, so concurrency is capped
+    # across all letter requests, not per request
+    executor = app_instance.extensions['letter_executor']
+    futures = {
+        executor.submit(generate_single_letter_task, url, cv_summary_text, cv_base_name): url
+        for url in job_urls
+    }
+    try:
+        # Tally outcomes here on the request thread, so the workers share no mutable state
+        for completed, future in enumerate(as_completed(futures, timeout=BULK_TIMEOUT_SECONDS), start=1):
+            job_url = futures.pop(future)
+            if future.result():
+                results['success_count'] += 1
+                generated_urls.append(job_url)
+            else:
+                results['errors'].append(job_url)
+            logger.info(f"Bulk letter generation progress: {completed}/{completed + len(futures)} (last: {job_url})")
+    except FuturesTimeoutError:
+        # Everything not yet tallied is reported as failed; queued URLs are cancelled
+        # and workers already calling the LLM finish in the background
+        logger.warning(f"Bulk letter generation hit the {BULK_TIMEOUT_SECONDS}s limit with {len(futures)} job(s) outstanding")
+        results['errors'].extend(futures.values())
+        for future in futures:
+            future.cancel()
+
+    # --- Auto-transition the jobs whose letter was written, as the single-letter route does ---
+    if generated_urls:
+        promote_generated_letters(generated_urls, cv_base_name)
+
+    logger.info(f"Multiple letter generation complete. Success: {results['success_count']}, Failures: {len(results['errors'])}, Skipped (existing): {len(results['skipped'])}")
     return jsonify(results)
 
 
@@ -372,7 +621,7 @@ def generate_multiple_letters():
 @admin_required
 def generate_multiple_emails():
     """Generate email texts for multiple selected jobs and update their JSON files."""
-    data = request.get_json()
+    data = request.get_json(silent=True) # Malformed JSON gets the 400 below instead of an HTML error page
     if not data:
         logger.error("Invalid request format for /generate_multiple_emails")
         return jsonify({'error': 'Invalid request format'}), 400
@@ -383,17 +632,19 @@ def generate_multiple_emails():
     if not job_urls or not isinstance(job_urls, list) or not cv_base_name:
         logger.error(f"Missing job_urls or cv_filename in request: {data}")
         return jsonify({'error': 'Missing job_urls or cv_filename'}), 400
+    if len(job_urls) > MAX_BULK_JOBS:
+        logger.error(f"Rejected bulk email request for {len(job_urls)} jobs (limit {MAX_BULK_JOBS})")
+        return jsonify({'error': f'Too many jobs selected ({len(job_urls)}); the limit is {MAX_BULK_JOBS} per request'}), 413
 
     logger.info(f"Received request to generate {len(job_urls)} email texts for CV: {cv_base_name}")
 
     cv_summary = None
     try:
-        summary_path = Path(current_app.root_path) / 'process_cv/cv-data/processed' / f"{cv_base_name}_summary.txt"
+        summary_path = get_cv_summary_path(current_app.root_path, cv_base_name)
         if not summary_path.exists():
             logger.error(f"Required CV summary file not found: {summary_path}")
             return jsonify({'error': f'Required CV summary file not found for {cv_base_name}'}), 400
-        with open(summary_path, 'r', encoding='utf-8') as f:
-            cv_summary = f.read()
+        cv_summary = load_cv_summary(summary_path)
     except Exception as e:
         logger.error(f"Error loading CV summary {summary_path}: {e}", exc_info=True)
         return jsonify({'error': f'Error loading CV summary: {e}'}), 500
@@ -402,84 +653,80 @@ def generate_multiple_emails():
          return jsonify({'error': 'CV summary could not be loaded.'}), 500
 
     results = {'success_count': 0, 'errors': [], 'not_found': []}
-    threads = []
-    lock = threading.Lock()
     app_instance = current_app._get_current_object()
+    letters_dir = letters_dir_for(app_instance.root_path) # Resolved once per request, shared by all workers
+    letters_dir.mkdir(parents=True, exist_ok=True) # Created once here so the workers' saves can skip it
+    # VALIDATE AND CLEAN URLS FIRST, so invalid ones never reach a worker
+    cleaned_urls = []
+    for original_url in job_urls:
+        job_url = URLNormalizer.clean_malformed_url(original_url)
+        if original_url != job_url:
+            logger.info(f"Cleaned malformed URL: '{original_url}' → '{job_url}'")
+        if is_fetchable_job_url(job_url):
+            cleaned_urls.append(job_url)
+        else:
+            logger.warning(f"Skipping invalid job URL after cleaning: {job_url} (original: {original_url})")
+            results['errors'].append({'url': original_url, 'reason': 'Invalid URL'})
 
-    from letter_generation_utils import generate_email_text_only
-
-    def generate_and_update_task(app, job_url):
-        nonlocal results
-        with app.app_context():
-            # VALIDATE AND CLEAN URL FIRST
-            from utils.url_utils import URLNormalizer
-            original_url = job_url
-            job_url = URLNormalizer.clean_malformed_url(job_url)
-            
-            if original_url != job_url:
-                logger.info(f"Cleaned malformed URL: '{original_url}' → '{job_url}'")
-            
-            if not job_url or job_url == 'N/A' or not job_url.startswith('http'):
-                logger.warning(f"Skipping invalid job URL after cleaning: {job_url} (original: {original_url})")
-                with lock: results['errors'].append({'url': original_url, 'reason': 'Invalid URL'})
-                return
+    def generate_and_update_task(job_url):
+        """Returns None on success, otherwise an error entry; the route tallies the results.
 
-            try:
-                job_details = get_job_details(job_url)
-                if not job_details or not job_details.get('Job Title'):
-                    logger.warning(f"Could not get sufficient job details for URL: {job_url}")
-                    with lock: results['errors'].append({'url': job_url, 'reason': 'Failed to get job details'})
-                    return
+        Like the letter worker, it needs no app context (letters_dir is resolved above).
+        """
+        try:
+            job_details = get_job_details(job_url) # Served by the job details cache when fetched recently
+            if not job_details or not job_details.get('Job Title'):
+                logger.warning(f"Could not get sufficient job details for URL: {job_url}")
+                return {'url': job_url, 'reason': 'Failed to get job details'}
 
-                job_title = job_details['Job Title']
-                sanitized_job_title = sanitize_filename(job_title)
-                letters_dir = Path(app.root_path) / 'motivation_letters'
-                json_file_path = letters_dir / f"motivation_letter_{sanitized_job_title}.json"
+            job_title = job_details['Job Title']
+            sanitized_job_title = sanitize_filename(job_title)
+            json_file_path = letters_dir / f"motivation_letter_{sanitized_job_title}.json"
 
-                logger.info(f"Generating email text for CV '{cv_base_name}' and Job '{job_title}' (URL: {job_url})")
-                email_text = generate_email_text_only(cv_summary, job_details)
+            logger.info(f"Generating email text for CV '{cv_base_name}' and Job '{job_title}' (URL: {job_url})")
+            email_text = generate_email_text_only(cv_summary, job_details)
 
-                if not email_text:
-                    logger.error(f"Failed to generate email text (generate_email_text_only returned None) for Job: {job_title}")
-                    with lock: results['errors'].append({'url': job_url, 'reason': 'Email text generation failed'})
-                    return
+            if not email_text:
+                logger.error(f"Failed to generate email text (generate_email_text_only returned None) for Job: {job_title}")
+                return {'url': job_url, 'reason': 'Email text generation failed'}
 
+            with letter_json_lock(json_file_path):
                 letter_data = {}
-                if json_file_path.is_file():
-                    try:
-                        with open(json_file_path, 'r', encoding='utf-8') as f:
-                            letter_data = json.load(f)
-                        logger.info(f"Loaded existing JSON: {json_file_path}")
-                    except Exception as load_e:
-                        logger.error(f"Error loading existing JSON {json_file_path}: {load_e}. Will overwrite.")
-                        letter_data = {}
-                else:
+                try:
+                    letter_data = read_json(json_file_path)
+                    logger.info(f"Loaded existing JSON: {json_file_path}")
+                except FileNotFoundError:
                     logger.info(f"JSON file not found ({json_file_path}), will create new.")
                     letter_data['job_title_source'] = job_title
+                except Exception as load_e:
+                    logger.error(f"Error loading existing JSON {json_file_path}: {load_e}. Will overwrite.")
+                    letter_data = {}
 
                 letter_data['email_text'] = email_text
 
-                try:
-                    letters_dir.mkdir(parents=True, exist_ok=True)
-                    with open(json_file_path, 'w', encoding='utf-8') as f:
-                        json.dump(letter_data, f, ensure_ascii=False, indent=2)
+                # save_json_file logs any error itself
+                if save_json_file(letter_data, json_file_path, indent=2, ensure_ascii=False, create_dirs=False):
                     logger.info(f"Successfully updated/created JSON with email text: {json_file_path}")
-                    with lock: results['success_count'] += 1
-                except Exception as save_e:
-                    logger.error(f"Error saving updated JSON {json_file_path}: {save_e}", exc_info=True)
-                    with lock: results['errors'].append({'url': job_url, 'reason': f'Failed to save JSON: {save_e}'})
-
-            except Exception as e:
-                logger.error(f"Exception generating/updating email text for URL {job_url}: {str(e)}", exc_info=True)
-                with lock: results['errors'].append({'url': job_url, 'reason': f'Unexpected error: {e}'})
-
-    for url in job_urls:
-        thread = threading.Thread(target=generate_and_update_task, args=(app_instance, url,))
-        threads.append(thread)
-        thread.start()
+                    return None
+                else:
+                    return {'url': job_url, 'reason': 'Failed to save JSON'}
 
-    for thread in threads:
-        thread.join()
+        except Exception as e:
+            logger.error(f"Exception generating/updating email text for URL {job_url}: {str(e)}", exc_info=True)
+            return {'url': job_url, 'reason': f'Unexpected error: {e}'}
+
+    # Same app-wide pool as letter generation: reuse worker threads and cap concurrent LLM calls
+    executor = app_instance.extensions['letter_executor']
+    futures = {executor.submit(generate_and_update_task, url): url for url in cleaned_urls}
+    # Popping each finished future drops the request's reference to it (and its result) right away
+    for completed, future in enumerate(as_completed(futures), start=1):
+        job_url = futures.pop(future)
+        error = future.result()
+        if error:
+            results['errors'].append(error)
+        else:
+            results['success_count'] += 1
+        logger.info(f"Bulk email text progress: {completed}/{completed + len(futures)} (last: {job_url})")
 
     logger.info(f"Multiple email text generation/update complete. Success: {results['success_count']}, Failures: {len(results['errors'])}")
     return jsonify(results)
@@ -504,13 +751,17 @@ def view_motivation_letter(operation_id):
                 flash(f'Motivation letter file not found: {html_path_rel}')
                 return redirect(url_for('index'))
 
-            with open(html_full_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # Revisits of an unchanged letter are answered with 304, skipping the read and render
+            etag = file_view_etag(html_full_path)
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+
+            html_content = load_letter_html(html_full_path)
 
             job_title_guess = html_full_path.stem.replace('motivation_letter_', '').replace('_', ' ')
             job_details = {'Job Title': job_title_guess, 'Application URL': '#'}
 
-            return render_template('motivation_letter.html',
+            return render_file_view(etag, 'motivation_letter.html',
                                   motivation_letter=html_content,
                                   file_path=html_path_rel,
                                   has_docx=bool(docx_path_rel),
@@ -518,17 +769,15 @@ def view_motivation_letter(operation_id):
                                   job_details=job_details,
                                   report_file=report_file)
 
-        operation_status = current_app.extensions.get('operation_status', {})
-        if operation_id not in operation_status or 'result' not in operation_status[operation_id]:
+        # In-memory status first, persisted copy as fallback (e.g. after a worker reload)
+        operation = current_app.extensions['get_operation'](operation_id)
+        status_info = operation[1] if operation else {}
+        if 'result' not in status_info:
             flash('Motivation letter generation result not found or not ready.')
-            status_info = operation_status.get(operation_id, {})
             report_file_from_status = status_info.get('result', {}).get('report_file')
-            if report_file_from_status:
-                 return redirect(url_for('job_matching.view_results', report_file=report_file_from_status))
-            else:
-                 return redirect(url_for('index'))
+            return redirect_back(report_file_from_status)
 
-        result = operation_status[operation_id]['result']
+        result = status_info['result']
         # Retrieve report_file from the stored result to pass to the template
         report_file = result.get('report_file')
 
@@ -563,7 +812,7 @@ def download_motivation_letter_html():
              logger.error(f"HTML file not found for download: {full_path}")
              return redirect(url_for('index'))
 
-        return send_file(str(full_path), as_attachment=True)
+        return send_letter_file(full_path)
     except Exception as e:
         flash(f'Error downloading motivation letter HTML: {str(e)}')
         logger.error(f'Error downloading HTML {file_path_rel}: {str(e)}', exc_info=True)
@@ -582,12 +831,13 @@ def download_motivation_letter_docx():
 
     try:
         full_path = Path(current_app.root_path) / file_path_rel
+        wait_for_pending_docx(full_path) # The letter task renders it in the background
         if not full_path.is_file():
              flash(f'File not found: {file_path_rel}')
              logger.error(f"DOCX file not found for download: {full_path}")
              return redirect(url_for('index'))
 
-        return send_file(str(full_path), as_attachment=True)
+        return send_letter_file(full_path)
     except Exception as e:
         flash(f'Error downloading Word document: {str(e)}')
         logger.error(f'Error downloading DOCX {file_path_rel}: {str(e)}', exc_info=True)
@@ -608,22 +858,30 @@ def download_docx_from_json():
         json_full_path = Path(current_app.root_path) / json_file_path_rel
         docx_full_path = json_full_path.with_suffix('.docx')
 
-        if not json_full_path.is_file():
+        try:
+            json_mtime_ns = os.stat(json_full_path).st_mtime_ns
+        except FileNotFoundError:
              flash(f'JSON file not found: {json_file_path_rel}')
              logger.error(f"JSON file not found for DOCX generation: {json_full_path}")
              return redirect(url_for('index'))
 
-        if not docx_full_path.is_file():
+        # The DOCX is derived from the JSON: only (re)build it when missing or older than the JSON
+        wait_for_pending_docx(docx_full_path) # Don't render it twice while the letter task's render runs
+        try:
+            docx_mtime_ns = os.stat(docx_full_path).st_mtime_ns
+        except FileNotFoundError:
+            docx_mtime_ns = None
+        if docx_mtime_ns is None or docx_mtime_ns < json_mtime_ns:
             logger.info(f"Generating Word document from JSON file: {json_full_path}")
-            generated_docx_path = create_word_document_from_json_file(str(json_full_path))
+            generated_docx_path = json_to_docx(load_letter_json(json_full_path), output_path=str(docx_full_path))
 
             if not generated_docx_path or not Path(generated_docx_path).is_file():
                 flash('Failed to generate Word document from JSON')
-                logger.error(f"create_word_document_from_json_file failed for {json_full_path}")
+                logger.error(f"json_to_docx failed for {json_full_path}")
                 return redirect(url_for('index'))
             docx_full_path = Path(generated_docx_path)
 
-        return send_file(str(docx_full_path), as_attachment=True)
+        return send_letter_file(docx_full_path)
     except Exception as e:
         flash(f'Error downloading Word document from JSON: {str(e)}')
         logger.error(f'Error downloading DOCX from JSON {json_file_path_rel}: {str(e)}', exc_info=True)
@@ -637,17 +895,20 @@ def view_scraped_data(scraped_data_filename):
     try:
         # Use the filename directly as passed from the URL (it was determined safely before)
         filename = scraped_data_filename
-        file_path = Path(current_app.root_path) / 'motivation_letters' / filename
+        file_path = letters_dir_for(current_app.root_path) / filename
 
         if not file_path.is_file():
             flash(f'Scraped job data file not found: {filename}')
             logger.error(f"Scraped job data file not found: {file_path}")
             return redirect(url_for('index'))
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            job_details = json.load(f)
+        etag = file_view_etag(file_path)
+        if is_not_modified(etag):
+            return not_modified_response(etag)
+
+        job_details = read_json(file_path)
 
-        return render_template('scraped_data_view.html', job_details=job_details, filename=filename)
+        return render_file_view(etag, 'scraped_data_view.html', job_details=job_details, filename=filename)
 
     except FileNotFoundError:
         flash(f'Scraped job data file not found: {filename}') # Use original filename in flash
@@ -676,18 +937,15 @@ def view_email_text():
         return redirect(url_for('index'))
 
     try:
-        json_full_path = Path(current_app.root_path) / json_path_rel
-        if not json_full_path.is_file():
+        json_full_path = os.path.join(current_app.root_path, json_path_rel)
+        try:
+            # load_letter_json stats the file anyway; a missing file surfaces here
+            letter_data = load_letter_json(json_full_path)
+        except (FileNotFoundError, IsADirectoryError):
             flash(f'Motivation letter JSON file not found: {json_path_rel}')
             logger.error(f"JSON file not found for email text view: {json_full_path}")
             # Try redirecting back to results if possible
-            if report_file:
-                 return redirect(url_for('job_matching.view_results', report_file=report_file))
-            else:
-                 return redirect(url_for('index'))
-
-        with open(json_full_path, 'r', encoding='utf-8') as f:
-            letter_data = json.load(f)
+            return redirect_back(report_file)
 
         # Get email_text, default to None if not found or empty
         email_text = letter_data.get('email_text')
@@ -702,17 +960,11 @@ def view_email_text():
     except json.JSONDecodeError:
         flash(f'Error decoding JSON from file: {json_path_rel}')
         logger.error(f"JSONDecodeError for email text view: {json_path_rel}")
-        if report_file:
-             return redirect(url_for('job_matching.view_results', report_file=report_file))
-        else:
-             return redirect(url_for('index'))
+        return redirect_back(report_file)
     except Exception as e:
         flash(f'Error viewing email text: {str(e)}')
         logger.error(f'Error viewing email text from {json_path_rel}: {str(e)}', exc_info=True)
-        if report_file:
-             return redirect(url_for('job_matching.view_results', report_file=report_file))
-        else:
-             return redirect(url_for('index'))
+        return redirect_back(report_file)
 
 
 @motivation_letter_bp.route('/upload_pdf', methods=['POST'])
@@ -737,7 +989,7 @@ def upload_bewerbungsschreiben_pdf():
         filename = f"Bewerbungsschreiben_{sanitized_title}.pdf"
         
         # Save to ready_to_send directory
-        upload_dir = Path(current_app.root_path) / 'motivation_letters/ready_to_send'
+        upload_dir = letters_dir_for(current_app.root_path) / 'ready_to_send'
         upload_dir.mkdir(parents=True, exist_ok=True)
         
         file_path = upload_dir / filename
@@ -832,22 +1084,24 @@ def prepare_send_application(job_title):
     try:
         # Load the email text from JSON
         sanitized_title = sanitize_filename(job_title)
-        json_path = Path(current_app.root_path) / 'motivation_letters' / f'motivation_letter_{sanitized_title}.json'
+        json_path = letters_dir_for(current_app.root_path) / f'motivation_letter_{sanitized_title}.json'
         
         email_text = ""
         job_details = {}
         
-        if json_path.is_file():
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                email_text = data.get('email_text', '')
-                # Load job details from the JSON
-                job_details = {
-                    'Job Title': data.get('job_title_source', job_title),
-                    'Company Name': data.get('company_name', ''),
-                    'Application Email': data.get('contact_email', ''),
-                    'Application URL': data.get('job_url', '')
-                }
+        try:
+            data = load_letter_json(json_path) # Shared parsed copy: read-only
+        except FileNotFoundError:
+            data = None
+        if data is not None:
+            email_text = data.get('email_text', '')
+            # Load job details from the JSON
+            job_details = {
+                'Job Title': data.get('job_title_source', job_title),
+                'Company Name': data.get('company_name', ''),
+                'Application Email': data.get('contact_email', ''),
+                'Application URL': data.get('job_url', '')
+            }
         
         return render_template(
             'send_application.html',
@@ -868,31 +1122,32 @@ def delete_letter_set(json_filename):
     """Delete a generated letter JSON and its associated HTML, DOCX, and scraped data files."""
     try:
         # Do NOT use secure_filename here as it might alter valid chars like umlauts
-        filename_base = json_filename.replace('motivation_letter_', '').replace('.json', '')
-        letters_dir = Path(current_app.root_path) / 'motivation_letters'
-
-        # Define paths for all potential files
-        json_path = letters_dir / f"motivation_letter_{filename_base}.json"
-        html_path = letters_dir / f"motivation_letter_{filename_base}.html"
-        docx_path = letters_dir / f"motivation_letter_{filename_base}.docx"
-        scraped_path = letters_dir / f"motivation_letter_{filename_base}_scraped_data.json"
+        # Strip only the fixed prefix/suffix so the set is addressed by its exact basename
+        filename_base = json_filename
+        if filename_base.startswith('motivation_letter_'):
+            filename_base = filename_base[len('motivation_letter_'):]
+        if filename_base.endswith('.json'):
+            filename_base = filename_base[:-len('.json')]
+        letters_dir = letters_dir_for(current_app.root_path)
 
         deleted_files = []
         not_found_files = []
 
-        # Attempt to delete each file if it exists
-        for file_path in [json_path, html_path, docx_path, scraped_path]:
-            if file_path.is_file():
-                try:
-                    os.remove(file_path)
-                    deleted_files.append(file_path.name)
-                    logger.info(f"Deleted file: {file_path}")
-                except Exception as e:
-                    logger.error(f"Error deleting file {file_path}: {e}")
-                    flash(f"Error deleting file {file_path.name}: {e}", "danger")
-            else:
-                not_found_files.append(file_path.name)
+        # Attempt to delete each file of the set (JSON, HTML, DOCX, scraped data); a missing
+        # file is reported by unlink itself (no extra stat)
+        for suffix in ('.json', '.html', '.docx', '_scraped_data.json'):
+            file_name = f"motivation_letter_{filename_base}{suffix}"
+            file_path = os.path.join(letters_dir, file_name)
+            try:
+                os.unlink(file_path)
+                deleted_files.append(file_name)
+                logger.info(f"Deleted file: {file_path}")
+            except FileNotFoundError:
+                not_found_files.append(file_name)
                 logger.debug(f"File not found for deletion (this is okay): {file_path}")
+            except Exception as e:
+                logger.error(f"Error deleting file {file_path}: {e}")
+                flash(f"Error deleting file {file_name}: {e}", "danger")
 
         if deleted_files:
             flash(f"Successfully deleted files related to: {filename_base.replace('_', ' ')}", "success")
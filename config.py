@@ -97,6 +97,9 @@ class ConfigManager:
     def _setup_paths(self):
         """Set up path mappings to all important directories and files"""
         self.PATHS = {}
+        # Unknown names already warned about; the file helpers probe get_path() with
+        # literal file paths on every call, which would otherwise log each time
+        self._missing_paths = set()
         
         # Main directories
         self.PATHS.update({
@@ -169,14 +172,29 @@ class ConfigManager:
                 # Model selection helpers
                 "fast_model": "gpt-5.1",  # With reasoning_effort="none"
                 "reasoning_model": "gpt-5.1",  # With reasoning_effort="high"
-                "mini_model": "gpt-5-mini"  # Cost-effective option
+                "mini_model": "gpt-5-mini",  # Cost-effective option
+                # Cap on in-flight API requests across all threads (size to the account's rate limit)
+                "max_concurrent_requests": int(self.get_env("OPENAI_MAX_CONCURRENT_REQUESTS", "8")),
+                # How long stored job-structuring results in the generation cache stay valid
+                "generation_cache_ttl_seconds": int(self.get_env("OPENAI_GENERATION_CACHE_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+            },
+            
+            # Letter generation defaults: worker threads mostly wait on the network, so the
+            # pool is sized above the API cap; DOCX rendering is CPU-bound and sized to cores
+            "letter_generation": {
+                "max_workers": int(self.get_env("LETTER_GENERATION_MAX_WORKERS", "16")),
+                "bulk_timeout_seconds": int(self.get_env("LETTER_GENERATION_BULK_TIMEOUT", "600")),
+                "docx_processes": int(self.get_env("LETTER_GENERATION_DOCX_PROCESSES", str(min(4, os.cpu_count() or 1)))),
+                "max_bulk_jobs": int(self.get_env("LETTER_GENERATION_MAX_BULK_JOBS", "200"))
             },
             
             # ScrapeGraphAI defaults (from settings.json if available)
             "scraper": {
                 "max_pages": self.SETTINGS.get("scraper", {}).get("max_pages", 50),
                 "headless": self.SETTINGS.get("scraper", {}).get("headless", True),
-                "verbose": self.SETTINGS.get("scraper", {}).get("verbose", False)
+                "verbose": self.SETTINGS.get("scraper", {}).get("verbose", False),
+                # Live-fetched job details are reused for this long before a page is scraped again
+                "details_cache_ttl_seconds": int(self.get_env("JOB_DETAILS_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
             }
         }
     
@@ -198,7 +216,8 @@ class ConfigManager:
     def get_path(self, path_name: str) -> Optional[Path]:
         """Get a path by name"""
         path = self.PATHS.get(path_name)
-        if not path:
+        if not path and path_name not in self._missing_paths:
+            self._missing_paths.add(path_name)
             logger.warning(f"Requested path not found: {path_name}")
         return path
     
@@ -2,10 +2,12 @@ import os
 import json
 import logging
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file, jsonify
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, send_file, jsonify
 from flask_login import login_required, current_user
 from werkzeug.utils import secure_filename
 import urllib.parse
@@ -22,6 +24,14 @@ logger = get_logger("dashboard")
 # Import necessary functions used only in this file or passed to blueprints
 # from job_matcher import load_latest_job_data # Keep if used in index or get_job_details
 
+# Operations (progress polling state) are kept this long after they were started
+OPERATION_RETENTION_SECONDS = 24 * 60 * 60
+# Intermediate progress updates are written to SQLite at most this often per operation;
+# start, completion and attached fields are always written immediately
+OPERATION_PERSIST_INTERVAL_SECONDS = 1.0
+# An idle /operation_events stream sends an SSE comment this often so proxies keep it open
+OPERATION_EVENT_HEARTBEAT_SECONDS = 15
+
 # --- Helper Functions ---
 # Note: get_job_details_for_url is complex and used by multiple blueprints.
 # It's kept here for now but ideally refactored into a shared utils module.
@@ -37,8 +47,9 @@ def get_job_details_for_url(job_url, cv_key=None):
         dict: Job details
     """
     import sqlite3
-    from utils.db_utils import JobMatchDatabase
+    from utils.db_utils import get_thread_database
     from utils.url_utils import URLNormalizer
+    from utils.file_utils import read_json
     
     temp_logger = logging.getLogger("dashboard.get_job_details")
     job_details = {}
@@ -47,10 +58,10 @@ def get_job_details_for_url(job_url, cv_key=None):
     normalizer = URLNormalizer()
     normalized_url = normalizer.normalize(job_url)
     
-    # Try database first
-    db = JobMatchDatabase()
+    # Try database first (both queries below are exact job_url matches on the
+    # UNIQUE(job_url, search_term, cv_key) index; the connection is reused per thread)
     try:
-        db.connect()
+        db = get_thread_database()
         cursor = db.conn.cursor()
         cursor.row_factory = sqlite3.Row  # Dict-like access
         
@@ -79,8 +90,6 @@ def get_job_details_for_url(job_url, cv_key=None):
             
     except Exception as e:
         temp_logger.warning(f"Database lookup failed for {job_url}: {e}")
-    finally:
-        db.close()
     
     # Fallback to JSON files (backward compatibility)
     temp_logger.info("Using JSON fallback for job details lookup")
@@ -102,9 +111,8 @@ def get_job_details_for_url(job_url, cv_key=None):
                 latest_job_data_file = max(job_data_files, key=os.path.getctime)
                 temp_logger.info(f"Latest job data file: {latest_job_data_file}")
 
-                # Load the job data
-                with open(latest_job_data_file, 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
+                # Load the job data (orjson when available; these files can be several MB)
+                job_data = read_json(latest_job_data_file)
 
                 # Process the job data based on its structure
                 job_listings = []
@@ -175,14 +183,12 @@ def query_job_matches(filters=None, sort_by='overall_match', sort_order='DESC',
         List of job match dicts
     """
     import sqlite3
-    from utils.db_utils import JobMatchDatabase
+    from utils.db_utils import get_thread_database
     
     temp_logger = logging.getLogger("dashboard.query_job_matches")
     
-    db = JobMatchDatabase()
+    db = get_thread_database() # This thread's long-lived connection; not closed here
     try:
-        db.connect()
-        
         # Build query
         query = "SELECT * FROM job_matches WHERE 1=1"
         params = []
@@ -246,8 +252,6 @@ def query_job_matches(filters=None, sort_by='overall_match', sort_order='DESC',
     except Exception as e:
         temp_logger.error(f"Error querying job matches: {e}")
         return []
-    finally:
-        db.close()
 
 
 # --- Logging is configured via utils/logging_config.py ---
@@ -260,9 +264,11 @@ def create_app():
     
     # --- Configuration ---
     # Load configuration from config.py
-    from config import get_secret_key, get_database_config
+    from config import config, get_secret_key, get_database_config
     app.config['SECRET_KEY'] = get_secret_key()
     app.config.update(get_database_config())
+    # Behind nginx/Apache, let the proxy stream downloads with sendfile(2) (opt-in)
+    app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'false').lower() == 'true'
     
     # Configure upload folder (can be overridden by instance config)
     app.config['UPLOAD_FOLDER'] = 'process_cv/cv-data/input'
@@ -270,8 +276,9 @@ def create_app():
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     
     # --- Initialize Extensions ---
-    from models import db, login_manager
+    from models import db, login_manager, init_sqlite_pragmas
     db.init_app(app)
+    init_sqlite_pragmas(app)
     login_manager.init_app(app)
 
     # --- Shared State / Utilities ---
@@ -279,53 +286,160 @@ def create_app():
     app.extensions['operation_progress'] = {}
     app.extensions['operation_status'] = {}
 
+    # Operation state is served from memory and written through to SQLite, so
+    # status and results survive a worker reload and old entries can be purged
+    from utils.db_utils import JobMatchDatabase
+    operation_db = JobMatchDatabase()
+    operation_db_lock = threading.Lock() # The connection is shared by all worker threads
+    operation_persisted_at = {} # operation_id -> time.monotonic() of the last write
+    operation_state_lock = threading.RLock() # Guards the operation_progress/operation_status dicts
+    # Wakes /operation_events streams; operation_versions counts the changes per operation
+    operation_changed = threading.Condition(operation_state_lock)
+    operation_versions = {}
+    try:
+        operation_db.init_operations_table()
+    except Exception as e:
+        logger.error(f"Could not initialize operations table, status will not be persisted: {e}")
+
+    def _persist_operation(operation_id, force=True):
+        """Write the in-memory state of an operation through to SQLite.
+
+        Unforced writes are skipped if the operation was written less than
+        OPERATION_PERSIST_INTERVAL_SECONDS ago; memory stays authoritative meanwhile.
+        """
+        now = time.monotonic()
+        if not force and now - operation_persisted_at.get(operation_id, 0.0) < OPERATION_PERSIST_INTERVAL_SECONDS:
+            return
+        with operation_state_lock:
+            progress = app.extensions['operation_progress'].get(operation_id)
+            status = app.extensions['operation_status'].get(operation_id)
+            if progress is None or status is None:
+                return
+            # Serialize a snapshot, not the live dict other threads keep updating
+            status = dict(status)
+        try:
+            with operation_db_lock:
+                operation_db.save_operation(operation_id, progress, status)
+                operation_persisted_at[operation_id] = now
+        except Exception as e:
+            logger.warning(f"Failed to persist operation {operation_id}: {e}")
+
+    def _mark_operation_changed(operation_id):
+        """Bump the operation's version and wake event streams; caller holds operation_state_lock."""
+        operation_versions[operation_id] = operation_versions.get(operation_id, 0) + 1
+        operation_changed.notify_all()
+
+    def _purge_old_operations():
+        """Drop operations older than OPERATION_RETENTION_SECONDS from memory and SQLite."""
+        cutoff = datetime.fromtimestamp(time.time() - OPERATION_RETENTION_SECONDS).isoformat()
+        with operation_state_lock:
+            op_status = app.extensions['operation_status']
+            for operation_id in [op_id for op_id, stat in op_status.items() if stat.get('start_time', '') < cutoff]:
+                op_status.pop(operation_id, None)
+                app.extensions['operation_progress'].pop(operation_id, None)
+                operation_persisted_at.pop(operation_id, None)
+                operation_versions.pop(operation_id, None)
+        try:
+            with operation_db_lock:
+                purged = operation_db.purge_operations(OPERATION_RETENTION_SECONDS)
+            if purged:
+                logger.info(f"Purged {purged} stored operation(s) older than {OPERATION_RETENTION_SECONDS}s")
+        except Exception as e:
+            logger.warning(f"Failed to purge old operations: {e}")
+
     # --- Helper Functions attached to app context ---
-    # These functions will be accessible via current_app.extensions in blueprints
+    # These functions will be accessible via current_app.extensions in blueprints.
+    # Worker threads update operations while request threads read them, so every
+    # access to the two state dicts goes through operation_state_lock.
     def start_operation(operation_type):
         """Start tracking a new operation"""
+        _purge_old_operations()
         operation_id = str(uuid.uuid4())
-        app.extensions['operation_progress'][operation_id] = 0
-        app.extensions['operation_status'][operation_id] = {
-            'type': operation_type,
-            'status': 'starting',
-            'message': f'Starting {operation_type}...',
-            'start_time': datetime.now().isoformat()
-        }
+        with operation_state_lock:
+            app.extensions['operation_progress'][operation_id] = 0
+            app.extensions['operation_status'][operation_id] = {
+                'type': operation_type,
+                'status': 'starting',
+                'message': f'Starting {operation_type}...',
+                'start_time': datetime.now().isoformat()
+            }
+            _mark_operation_changed(operation_id)
+        _persist_operation(operation_id)
         logger.info(f"Started operation {operation_id} ({operation_type})")
         return operation_id
 
     def update_operation_progress(operation_id, progress, status=None, message=None):
         """Update the progress of an operation"""
-        if operation_id in app.extensions['operation_progress']:
+        with operation_state_lock:
+            if operation_id not in app.extensions['operation_progress']:
+                return
             app.extensions['operation_progress'][operation_id] = progress
-
+            op_stat = app.extensions['operation_status'].get(operation_id, {})
             if status or message:
-                if operation_id in app.extensions['operation_status']:
-                    op_stat = app.extensions['operation_status'][operation_id]
-                    if status:
-                        op_stat['status'] = status
-                    if message:
-                        op_stat['message'] = message
-                    op_stat['updated_time'] = datetime.now().isoformat()
-            current_message = app.extensions['operation_status'].get(operation_id, {}).get('message', '')
-            logger.info(f"Operation {operation_id}: {progress}% complete - {message or current_message}")
+                if status:
+                    op_stat['status'] = status
+                if message:
+                    op_stat['message'] = message
+                op_stat['updated_time'] = datetime.now().isoformat()
+            current_message = op_stat.get('message', '')
+            _mark_operation_changed(operation_id)
+        _persist_operation(operation_id, force=False)
+        logger.info(f"Operation {operation_id}: {progress}% complete - {current_message}")
 
     def complete_operation(operation_id, status='completed', message='Operation completed'):
         """Mark an operation as completed"""
-        if operation_id in app.extensions['operation_progress']:
-            app.extensions['operation_progress'][operation_id] = 100
-
-            if operation_id in app.extensions['operation_status']:
-                op_stat = app.extensions['operation_status'][operation_id]
-                op_stat['status'] = status
-                op_stat['message'] = message
-                op_stat['completed_time'] = datetime.now().isoformat()
+        with operation_state_lock:
+            known = operation_id in app.extensions['operation_progress']
+            if known:
+                app.extensions['operation_progress'][operation_id] = 100
+                op_stat = app.extensions['operation_status'].get(operation_id)
+                if op_stat is not None:
+                    op_stat['status'] = status
+                    op_stat['message'] = message
+                    op_stat['completed_time'] = datetime.now().isoformat()
+                _mark_operation_changed(operation_id)
+        if known:
+            _persist_operation(operation_id)
         logger.info(f"Operation {operation_id} {status}: {message}")
 
+    def set_operation_field(operation_id, key, value):
+        """Attach extra data (e.g. 'result' or 'report_file') to an operation's status"""
+        with operation_state_lock:
+            op_stat = app.extensions['operation_status'].get(operation_id)
+            if op_stat is None:
+                return
+            op_stat[key] = value
+            _mark_operation_changed(operation_id)
+        _persist_operation(operation_id)
+
+    def get_operation(operation_id):
+        """Return (progress, status) for an operation from memory, falling back to SQLite"""
+        with operation_state_lock:
+            op_progress = app.extensions['operation_progress']
+            op_status = app.extensions['operation_status']
+            if operation_id in op_progress and operation_id in op_status:
+                # A copy, so the caller can serialize it while workers keep updating
+                return op_progress[operation_id], dict(op_status[operation_id])
+        try:
+            with operation_db_lock:
+                return operation_db.get_operation(operation_id)
+        except Exception as e:
+            logger.warning(f"Failed to load operation {operation_id} from database: {e}")
+            return None
+
+    # One process-wide pool for letter/email generation (single-letter background tasks and
+    # bulk requests), so bursts of requests queue up instead of each spawning new threads
+    app.extensions['letter_executor'] = ThreadPoolExecutor(
+        max_workers=config.get_default('letter_generation', 'max_workers', 8),
+        thread_name_prefix='letter'
+    )
+
     # Attach helper functions to app extensions for blueprint access
     app.extensions['start_operation'] = start_operation
     app.extensions['update_operation_progress'] = update_operation_progress
     app.extensions['complete_operation'] = complete_operation
+    app.extensions['set_operation_field'] = set_operation_field
+    app.extensions['get_operation'] = get_operation
     app.extensions['get_job_details_for_url'] = get_job_details_for_url
 
     # --- Register Blueprints ---
@@ -352,18 +466,53 @@ def create_app():
     @login_required
     def get_operation_status_route(operation_id):
         """Get the status of an operation"""
-        # Access progress/status via app extensions
-        op_progress = app.extensions.get('operation_progress', {})
-        op_status = app.extensions.get('operation_status', {})
-        if operation_id in op_progress and operation_id in op_status:
+        # Memory first, then the persisted copy (e.g. after a worker reload)
+        operation = get_operation(operation_id)
+        if operation:
+            progress, status = operation
             return jsonify({
-                'progress': op_progress[operation_id],
-                'status': op_status[operation_id]
+                'progress': progress,
+                'status': status
             })
         else:
             logger.warning(f"Operation status requested for unknown ID: {operation_id}")
             return jsonify({'error': 'Operation not found'}), 404
 
+    @app.route('/operation_events/<operation_id>')
+    @login_required
+    def operation_events_route(operation_id):
+        """Stream an operation's progress as server-sent events until it finishes.
+
+        Each event carries the same {'progress', 'status'} payload as /operation_status.
+        The stream ends when the operation completes or fails, or when it is only known
+        from SQLite (no live worker will update it); clients then fall back to polling.
+        """
+        if get_operation(operation_id) is None:
+            logger.warning(f"Operation events requested for unknown ID: {operation_id}")
+            return jsonify({'error': 'Operation not found'}), 404
+
+        def stream():
+            seen_version = object() # Matches no version, so the current state is sent first
+            while True:
+                with operation_changed:
+                    if operation_versions.get(operation_id) == seen_version:
+                        operation_changed.wait(OPERATION_EVENT_HEARTBEAT_SECONDS)
+                    version = operation_versions.get(operation_id)
+                if version == seen_version:
+                    yield ': heartbeat\n\n'
+                    continue
+                seen_version = version
+                operation = get_operation(operation_id)
+                if operation is None:
+                    return
+                progress, status = operation
+                yield f"data: {json.dumps({'progress': progress, 'status': status})}\n\n"
+                if version is None or progress == 100 or status.get('status') in ('completed', 'failed'):
+                    return
+
+        return Response(stream(), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
     @app.route('/')
     @login_required
     def index():
@@ -453,14 +602,10 @@ def create_app():
                     logger.warning(f"Could not make path relative: {file_path} to {base_path}")
                     return None # Or return absolute path as string?
 
-            # Use sanitize_filename helper (assuming it's defined globally or imported)
-            # If not, define it here or import it
-            def sanitize_filename_local(name, length=30):
-                 sanitized = ''.join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in name)
-                 sanitized = sanitized.replace(' ', '_')
-                 return sanitized[:length]
-
-            json_files = list(letters_dir.glob('motivation_letter_*.json'))
+            # List the directory once; existence checks below are set lookups instead of stat() calls
+            letter_entries = {entry.name: entry for entry in os.scandir(letters_dir) if entry.is_file()}
+            json_files = [letters_dir / name for name in letter_entries
+                          if name.startswith('motivation_letter_') and name.endswith('.json')]
             logger.info(f"Found {len(json_files)} potential letter JSON files in {letters_dir}")
             for json_path in json_files:
                 if "_scraped_data" in json_path.name: # Skip scraped data files
@@ -482,13 +627,13 @@ def create_app():
                     docx_path = letters_dir / f"{base_name}.docx"
                     scraped_path = letters_dir / f"{base_name}_scraped_data.json"
 
-                    # Check existence
-                    has_html = html_path.is_file()
-                    has_docx = docx_path.is_file()
-                    has_scraped = scraped_path.is_file()
+                    # Check existence against the directory listing
+                    has_html = html_path.name in letter_entries
+                    has_docx = docx_path.name in letter_entries
+                    has_scraped = scraped_path.name in letter_entries
 
                     # Get modification time from JSON file
-                    mtime = os.path.getmtime(json_path)
+                    mtime = letter_entries[json_path.name].stat().st_mtime
                     timestamp = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
 
                     generated_letters_data.append({
@@ -1,4 +1,5 @@
 import json
+import threading
 import openai
 from pathlib import Path
 from datetime import datetime
@@ -12,6 +13,7 @@ from config import config, get_openai_api_key, get_openai_defaults, get_latest_j
 from utils.file_utils import load_json_file, flatten_nested_job_data
 from utils.api_utils import openai_client, generate_json_from_prompt
 from utils.decorators import handle_exceptions, log_execution_time, retry
+from utils.db_utils import get_thread_database
 
 # Set up logging using centralized configuration
 from utils.logging_config import get_logger
@@ -69,16 +71,51 @@ def has_sufficient_content(details_dict):
     # This ensures we have *some* content to base the motivation letter on.
     return has_desc or has_resp or has_skills
 
+# Fields holding the actual job content, with the placeholder each one falls back to
+JOB_CONTENT_FIELDS = {
+    'Job Description': 'No description available',
+    'Responsibilities': 'No specific responsibilities listed',
+    'Required Skills': 'No specific skills listed',
+}
+# Below this many characters of real job content a letter is not worth an LLM call
+MIN_JOB_CONTENT_CHARS = 20
+
+def job_content_length(details_dict):
+    """Counts the characters of real content in the description, responsibilities and skills."""
+    if not isinstance(details_dict, dict):
+        return 0
+
+    total = 0
+    for field, placeholder in JOB_CONTENT_FIELDS.items():
+        value = details_dict.get(field)
+        if isinstance(value, list):
+            value = ' '.join(str(item) for item in value)
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        # Placeholders are not content
+        if placeholder in value or value.upper() in ["N/A", "NA"]:
+            continue
+        total += len(value)
+    return total
+
+def has_minimal_content(details_dict):
+    """Checks if extracted details have at least MIN_JOB_CONTENT_CHARS of real job content."""
+    return job_content_length(details_dict) >= MIN_JOB_CONTENT_CHARS
+
 @handle_exceptions(default_return=None)
 @log_execution_time()
-def structure_text_with_openai(text_content, source_url, source_type="HTML"):
+def structure_text_with_openai(text_content, source_url, source_type="HTML", refresh=False):
     """
     Uses OpenAI to structure extracted text from HTML or PDF.
     
+    Identical text is structured once; the result is reused from the generation cache.
+    
     Args:
         text_content (str): The raw text content from the job posting
         source_url (str): The URL of the job posting
         source_type (str): The type of source (HTML, PDF, etc.)
+        refresh (bool): Ignore a cached result and call the API again
         
     Returns:
         dict: Structured job details or None if extraction fails
@@ -121,7 +158,9 @@ def structure_text_with_openai(text_content, source_url, source_type="HTML"):
     job_details = generate_json_from_prompt(
         prompt=structuring_prompt,
         system_prompt=system_prompt,
-        default=None
+        default=None,
+        persistent_cache=True,
+        refresh=refresh
     )
     
     if not job_details:
@@ -143,6 +182,52 @@ def structure_text_with_openai(text_content, source_url, source_type="HTML"):
     
     return job_details
 
+# Parsed pre-scraped data, keyed by file path: (mtime_ns, size, all_jobs, jobs_by_id).
+# The latest job data file is re-read only when it changes, and the id index turns the
+# per-URL lookup into a dict hit instead of a scan over every job.
+_SCRAPED_JOBS_CACHE = {}
+_SCRAPED_JOBS_LOCK = threading.Lock()
+
+def _load_scraped_jobs(job_data_file):
+    """
+    Return (all_jobs, jobs_by_id) for a pre-scraped job data file, parsing it only when it changed.
+
+    jobs_by_id maps the last path segment of each job's Application URL to the first job with it.
+    Returns (None, None) if the file cannot be loaded or holds no jobs.
+    """
+    job_data_file = Path(job_data_file)
+    st = job_data_file.stat()
+    with _SCRAPED_JOBS_LOCK:
+        cached = _SCRAPED_JOBS_CACHE.get(job_data_file)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+
+    job_data_pages = load_json_file(job_data_file)
+    if not job_data_pages:
+        logger.error(f"Failed to load job data from {job_data_file}")
+        return None, None
+
+    all_jobs = flatten_nested_job_data(job_data_pages)
+    if not all_jobs:
+        logger.error("Failed to flatten job data, or data is empty.")
+        return None, None
+
+    jobs_by_id = {}
+    for i, job in enumerate(all_jobs):
+        if not isinstance(job, dict):
+            logger.warning(f"Skipping non-dictionary item at index {i} in flattened job list.")
+            continue
+        job_application_url = job.get('Application URL', '')
+        if isinstance(job_application_url, str):
+            jobs_by_id.setdefault(job_application_url.split('/')[-1], job)
+
+    logger.info(f"Loaded and flattened job data with {len(all_jobs)} total jobs.")
+    with _SCRAPED_JOBS_LOCK:
+        # Only the latest file is ever looked up, so drop entries for older files
+        _SCRAPED_JOBS_CACHE.clear()
+        _SCRAPED_JOBS_CACHE[job_data_file] = (st.st_mtime_ns, st.st_size, all_jobs, jobs_by_id)
+    return all_jobs, jobs_by_id
+
 @handle_exceptions(default_return=None)
 @log_execution_time()
 def get_job_details_from_scraped_data(job_url):
@@ -169,33 +254,26 @@ def get_job_details_from_scraped_data(job_url):
 
     logger.info(f"Using latest pre-scraped data file: {latest_job_data_file}")
 
-    # Load job data using utility function
-    job_data_pages = load_json_file(latest_job_data_file)
-    if not job_data_pages:
-        logger.error(f"Failed to load job data from {latest_job_data_file}")
-        return None
-
-    # Flatten job data structure
-    all_jobs = flatten_nested_job_data(job_data_pages)
+    # Load job data (parsed once per file version, see _load_scraped_jobs)
+    all_jobs, jobs_by_id = _load_scraped_jobs(latest_job_data_file)
     if not all_jobs:
-        logger.error("Failed to flatten job data, or data is empty.")
         return None
 
-    logger.info(f"Loaded and flattened job data with {len(all_jobs)} total jobs.")
-
-    # Search for matching job
-    found_job = None
-    for i, job in enumerate(all_jobs):
-        if not isinstance(job, dict):
-            logger.warning(f"Skipping non-dictionary item at index {i} in flattened job list.")
-            continue
-        job_application_url = job.get('Application URL', '')
-        if isinstance(job_application_url, str) and job_id in job_application_url.split('/')[-1]:
-            logger.info(f"Found matching job: {job.get('Job Title', 'N/A')} at {job.get('Company Name', 'N/A')}")
-            found_job = job
-            break
+    # Exact id match from the index; fall back to the original partial-id scan
+    found_job = jobs_by_id.get(job_id)
+    if found_job is None:
+        for job in all_jobs:
+            if not isinstance(job, dict):
+                continue
+            job_application_url = job.get('Application URL', '')
+            if isinstance(job_application_url, str) and job_id in job_application_url.split('/')[-1]:
+                found_job = job
+                break
 
     if found_job:
+        logger.info(f"Found matching job: {found_job.get('Job Title', 'N/A')} at {found_job.get('Company Name', 'N/A')}")
+        # Copy so callers can't modify the cached entry
+        found_job = dict(found_job)
         # Make URL absolute if needed
         if isinstance(found_job.get('Application URL'), str) and found_job['Application URL'].startswith('/'):
             base_url = "https://www.ostjob.ch/"
@@ -205,22 +283,62 @@ def get_job_details_from_scraped_data(job_url):
     logger.warning(f"Job with ID '{job_id}' not found in latest pre-scraped data file: {latest_job_data_file}")
     return None
 
+# The job_details_cache table is created on first use, once per process
+_job_details_cache_ready = False
+_job_details_cache_lock = threading.Lock()
+
+def _get_job_details_cache_db():
+    """Return this thread's database with the job_details_cache table in place."""
+    global _job_details_cache_ready
+    db = get_thread_database()
+    if not _job_details_cache_ready:
+        with _job_details_cache_lock:
+            if not _job_details_cache_ready:
+                db.init_job_details_cache_table()
+                _job_details_cache_ready = True
+    return db
+
+def _load_cached_job_details(job_url, max_age_seconds):
+    """Return job details live-fetched for job_url within max_age_seconds, or None."""
+    try:
+        cached = _get_job_details_cache_db().get_cached_job_details(job_url, max_age_seconds)
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"Job details cache lookup failed for {job_url}: {e}")
+        return None
+
+def _store_cached_job_details(job_url, job_details):
+    """Remember live-fetched job details; failures only cost a later re-fetch."""
+    try:
+        _get_job_details_cache_db().save_cached_job_details(job_url, json.dumps(job_details, ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"Could not cache job details for {job_url}: {e}")
+
 @handle_exceptions(default_return=None)
 @log_execution_time()
-def get_job_details(job_url):
+def get_job_details(job_url, refresh=False):
     """
     Get job details for a given URL using the simplified ScrapeGraphAI-first approach.
 
     Order of operations:
+    0. Reuse details live-fetched within the scraper's details_cache_ttl_seconds.
     1. Attempt live fetch: GraphScrapeAI Structured Extraction (headless=False).
     2. Fallback to pre-scraped data.
     
     Args:
         job_url (str): URL of the job posting
+        refresh (bool): Skip the cache and scrape the page again
         
     Returns:
         dict: Job details dictionary or None if all methods fail
     """
+    cache_ttl = config.get_default("scraper", "details_cache_ttl_seconds", 0)
+    if cache_ttl and not refresh:
+        cached_details = _load_cached_job_details(job_url, cache_ttl)
+        if cached_details:
+            logger.info(f"Using job details fetched within the last {cache_ttl}s for URL: {job_url}")
+            return cached_details
+
     # --- Attempt 1: GraphScrapeAI Structured Extraction (headless=False) ---
     logger.info(f"Attempt 1: Trying GraphScrapeAI structured extraction (headless=False) for URL: {job_url}")
     structured_details = None
@@ -238,6 +356,8 @@ def get_job_details(job_url):
                 if isinstance(structured_details.get('Application URL'), str) and not structured_details['Application URL'].startswith('http'):
                      base_url = "https://www.ostjob.ch/" # Assuming base URL
                      structured_details['Application URL'] = urljoin(base_url, structured_details['Application URL'].lstrip('/'))
+                if cache_ttl:
+                    _store_cached_job_details(job_url, structured_details)
                 # Return the successful result immediately
                 return structured_details
             else:
@@ -36,6 +36,9 @@ from utils.cv_utils import generate_cv_key
 
 # OpenAI client is imported from api_utils and already initialized
 
+# Evaluated matches are written in transactions of this many jobs, so a crash loses at most one batch
+MATCH_INSERT_BATCH_SIZE = 20
+
 @handle_exceptions(default_return=[])
 def match_jobs(cv_summary, cv_key, search_term=None):
     """
@@ -318,8 +321,6 @@ def match_jobs_with_cv_dedup(cv_path, search_term, min_score=6, max_jobs=50):
     Returns:
         list: List of job matches that meet the minimum score threshold
     """
-    import sqlite3
-    
     db = None
     try:
         # Initialize database
@@ -356,9 +357,36 @@ def match_jobs_with_cv_dedup(cv_path, search_term, min_score=6, max_jobs=50):
         # Initialize URL normalizer and counters
         normalizer = URLNormalizer()
         matches = []
+        pending_matches = []  # (match_data, job, job_url) entries, written every MATCH_INSERT_BATCH_SIZE jobs
+        seen_urls = set()  # URLs evaluated in this run, including those not written yet
+        batch_scraped_at = datetime.now().isoformat()  # One timestamp for the whole batch
         skipped_count = 0
         new_count = 0
         
+        def save_pending_matches():
+            """Write the pending matches in one transaction and collect those meeting min_score."""
+            nonlocal skipped_count, new_count
+            row_ids = db.insert_job_matches([match_data for match_data, _, _ in pending_matches])
+            for (match_data, job, job_url), row_id in zip(pending_matches, row_ids):
+                if row_id is None:
+                    # Race condition: Another process inserted this job
+                    logger.debug(f"Race condition: {job_url} already inserted")
+                    skipped_count += 1
+                    continue
+                
+                logger.debug(f"Saved match: {match_data['job_title']}")
+                new_count += 1
+                
+                # Add to results if meets min_score
+                if match_data['overall_match'] >= min_score:
+                    # Create result dict with additional fields for compatibility
+                    result = match_data.copy()
+                    result['job_description'] = job.get('Job Description', 'N/A')
+                    result['application_url'] = job_url
+                    result['cv_path'] = cv_path
+                    matches.append(result)
+            pending_matches.clear()
+        
         # Process each job with deduplication check
         for job in job_listings:
             job_title = job.get('Job Title', 'Unknown')
@@ -367,11 +395,12 @@ def match_jobs_with_cv_dedup(cv_path, search_term, min_score=6, max_jobs=50):
             # Normalize URL before database operations
             job_url = normalizer.normalize(raw_url)
             
-            # Check if job already matched
-            if db.job_exists(job_url, search_term, cv_key):
+            # Check if job already matched (in the database or earlier in this run)
+            if job_url in seen_urls or db.job_exists(job_url, search_term, cv_key):
                 skipped_count += 1
                 logger.debug(f"Already matched: {job_url}")
                 continue
+            seen_urls.add(job_url)
             
             # Evaluate with OpenAI (only for new jobs)
             try:
@@ -398,34 +427,21 @@ def match_jobs_with_cv_dedup(cv_path, search_term, min_score=6, max_jobs=50):
                     'location_compatibility': evaluation.get('location_compatibility'),
                     'reasoning': evaluation.get('reasoning', ''),
                     'scraped_data': json.dumps(job),  # Store complete job data as JSON string
-                    'scraped_at': datetime.now().isoformat()
+                    'scraped_at': batch_scraped_at
                 }
                 
-                # Save to database
-                try:
-                    db.insert_job_match(match_data)
-                    logger.debug(f"Saved match: {job_title}")
-                    new_count += 1
-                    
-                    # Add to results if meets min_score
-                    if match_data['overall_match'] >= min_score:
-                        # Create result dict with additional fields for compatibility
-                        result = match_data.copy()
-                        result['job_description'] = job.get('Job Description', 'N/A')
-                        result['application_url'] = job_url
-                        result['cv_path'] = cv_path
-                        matches.append(result)
-                        
-                except sqlite3.IntegrityError:
-                    # Race condition: Another process inserted this job
-                    logger.debug(f"Race condition: {job_url} already inserted")
-                    skipped_count += 1
+                pending_matches.append((match_data, job, job_url))
+                if len(pending_matches) >= MATCH_INSERT_BATCH_SIZE:
+                    save_pending_matches()
                     
             except Exception as e:
                 logger.error(f"Error evaluating {job_url}: {e}")
                 # Continue processing other jobs
                 continue
         
+        # Save the last partial batch
+        save_pending_matches()
+        
         # Log summary statistics
         logger.info(f"Matched {new_count} new jobs (total evaluated)")
         logger.info(f"Returned {len(matches)} jobs with score >= {min_score}")
@@ -549,20 +565,28 @@ def evaluate_and_save_matches(cv_path, new_jobs, search_term):
         normalizer = URLNormalizer()
 
         matched_count = 0
+        pending_matches = []
+        seen_urls = set()  # Jobs listed twice in new_jobs are evaluated once
+        batch_scraped_at = datetime.now().isoformat()  # One timestamp for the whole batch
 
         try:
-            # Evaluate each new job and save to database
+            # Evaluate each new job; results are saved in transactions of MATCH_INSERT_BATCH_SIZE jobs
             for job in new_jobs:
                 try:
                     job_title = job.get('Job Title', 'Unknown')
-                    logger.info(f"Evaluating: {job_title}")
-
-                    # Evaluate job match
-                    evaluation = evaluate_job_match(cv_summary, job)
 
                     # Normalize URL
                     raw_url = job.get('Application URL', '')
                     job_url = normalizer.normalize(raw_url)
+                    if job_url in seen_urls:
+                        logger.debug(f"Already evaluated in this run: {job_url}")
+                        continue
+                    seen_urls.add(job_url)
+
+                    logger.info(f"Evaluating: {job_title}")
+
+                    # Evaluate job match
+                    evaluation = evaluate_job_match(cv_summary, job)
 
                     # Prepare match data for database
                     match_data = {
@@ -584,17 +608,23 @@ def evaluate_and_save_matches(cv_path, new_jobs, search_term):
                         'location_compatibility': evaluation.get('location_compatibility'),
                         'reasoning': evaluation.get('reasoning', ''),
                         'scraped_data': json.dumps(job),
-                        'scraped_at': datetime.now().isoformat()
+                        'scraped_at': batch_scraped_at
                     }
 
-                    # Insert into database
-                    db.insert_job_match(match_data)
-                    matched_count += 1
-                    logger.info(f"Matched and saved: {job_title} (score: {match_data['overall_match']}/10)")
+                    pending_matches.append(match_data)
+                    logger.info(f"Matched: {job_title} (score: {match_data['overall_match']}/10)")
+
+                    if len(pending_matches) >= MATCH_INSERT_BATCH_SIZE:
+                        row_ids = db.insert_job_matches(pending_matches)
+                        matched_count += sum(1 for row_id in row_ids if row_id is not None)
+                        pending_matches = []
 
                 except Exception as job_e:
                     logger.error(f"Error evaluating job {job.get('Job Title', 'Unknown')}: {job_e}")
                     continue
+
+            row_ids = db.insert_job_matches(pending_matches)
+            matched_count += sum(1 for row_id in row_ids if row_id is not None)
         finally:
             db.close()
 
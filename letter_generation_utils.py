@@ -6,6 +6,7 @@ using the OpenAI API and converting the generated content to HTML format.
 """
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 # Import from centralized configuration
@@ -14,6 +15,7 @@ from config import config, get_openai_api_key, get_openai_defaults
 # Import utilities
 from utils.file_utils import (
     save_json_file,
+    atomic_write_bytes,
     ensure_output_directory,
     create_application_folder,
     create_metadata_file,
@@ -72,8 +74,15 @@ def json_to_html(motivation_letter_json):
 
 @handle_exceptions(default_return=None)
 @log_execution_time()
-def generate_motivation_letter(cv_summary, job_details):
-    """Generate a motivation letter using OpenAI API"""
+def generate_motivation_letter(cv_summary, job_details, cv_pdf=None, refresh=False, render_docx=None):
+    """Generate a motivation letter using OpenAI API.
+
+    cv_pdf: CV PDF to copy into the application folder; looked up per call when None.
+    refresh: Write a new letter even if the same CV summary and job details were sent
+    to the API within the last hour (the in-memory response cache is skipped).
+    render_docx: Callable(letter_json, docx_path) that renders the folder's DOCX elsewhere
+    (e.g. a process pool); rendered inline when None.
+    """
     # Extract pre-determined salutation, default if not found
     extracted_salutation = job_details.get('Salutation', 'Sehr geehrte Damen und Herren')
     if not extracted_salutation or not isinstance(extracted_salutation, str) or len(extracted_salutation.strip()) == 0:
@@ -186,7 +195,8 @@ def generate_motivation_letter(cv_summary, job_details):
     motivation_letter_json = generate_json_from_prompt(
         prompt=prompt,
         system_prompt=system_prompt,
-        default={}
+        default={},
+        refresh=refresh
     )
     
     # If we didn't get a valid result
@@ -222,29 +232,34 @@ def generate_motivation_letter(cv_summary, job_details):
 
     # Save HTML
     logger.info(f"Saving HTML motivation letter to: {html_file_path}")
-    with open(html_file_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    atomic_write_bytes(html_file_path, html_content.encode('utf-8'))
 
     # Save JSON (application data)
     logger.info(f"Saving JSON motivation letter to: {json_file_path}")
-    save_json_file(motivation_letter_json, json_file_path, ensure_ascii=False, indent=2)
+    save_json_file(motivation_letter_json, json_file_path, ensure_ascii=False, indent=2, create_dirs=False)
 
-    # Save job details
+    # Save job details (compact: only read back by code)
     logger.info(f"Saving job details to: {scraped_data_path}")
-    save_json_file(job_details, scraped_data_path, ensure_ascii=False, indent=2)
+    save_json_file(job_details, scraped_data_path, ensure_ascii=False, indent=None, create_dirs=False)
 
     # Create checkpoint infrastructure files
-    create_metadata_file(app_folder, job_details)
-    copy_cv_to_folder(app_folder)
-    create_status_file(app_folder)
+    # One timestamp for the whole package, so metadata and status agree
+    generated_at = datetime.now().isoformat()
+    create_metadata_file(app_folder, job_details, timestamp=generated_at)
+    copy_cv_to_folder(app_folder, cv_pdf=cv_pdf)
+    create_status_file(app_folder, timestamp=generated_at)
 
     # Generate DOCX file in checkpoint folder
-    from word_template_generator import json_to_docx
     docx_file_path = app_folder / 'bewerbungsschreiben.docx'
-    logger.info(f"Generating DOCX file: {docx_file_path}")
-    docx_result = json_to_docx(motivation_letter_json, output_path=str(docx_file_path))
-    if not docx_result:
-        logger.warning("Failed to generate DOCX file")
+    if render_docx is not None:
+        logger.info(f"Submitting DOCX file for rendering: {docx_file_path}")
+        render_docx(motivation_letter_json, docx_file_path)
+    else:
+        from word_template_generator import json_to_docx
+        logger.info(f"Generating DOCX file: {docx_file_path}")
+        docx_result = json_to_docx(motivation_letter_json, output_path=str(docx_file_path))
+        if not docx_result:
+            logger.warning("Failed to generate DOCX file")
 
     # --- CV TEMPLATE GENERATION (Story 6.2) ---
     # Generate customized CV template DOCX
@@ -2,8 +2,11 @@
 Models package for JobSearchAI authentication system.
 """
 
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
+from sqlalchemy import event
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -12,6 +15,33 @@ login_manager.login_view = 'auth.login'
 login_manager.login_message = 'Please log in to access this page.'
 login_manager.login_message_category = 'info'
 
+# Same journal settings JobMatchDatabase uses, for when DATABASE_URL points at SQLite:
+# WAL lets the login/user queries read while the job tables are written, and NORMAL sync
+# commits with one WAL append instead of journal fsyncs
+SQLITE_PRAGMA_SETTINGS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+}
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMA_SETTINGS to each new pooled SQLite connection."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PRAGMA_SETTINGS.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+    finally:
+        cursor.close()
+
+
+def init_sqlite_pragmas(app):
+    """Register _apply_sqlite_pragmas on the app's SQLAlchemy engine (call after db.init_app)."""
+    with app.app_context():
+        event.listen(db.engine, 'connect', _apply_sqlite_pragmas)
+
+
 # Import models after db initialization to avoid circular imports
 from .user import User
 
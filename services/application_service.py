@@ -1,4 +1,4 @@
-from utils.db_utils import JobMatchDatabase
+from utils.db_utils import get_thread_database
 from models.application_status import ApplicationStatus
 
 # Set up logging using centralized configuration
@@ -10,14 +10,12 @@ def get_application_status(job_match_id):
     Get the status of an application by job_match_id.
     Returns 'MATCHED' if no application record exists.
     """
-    db = JobMatchDatabase()
+    db = get_thread_database()
     try:
         return db.get_application_status(job_match_id)
     except Exception as e:
         logger.error(f"Error getting application status: {e}")
         return ApplicationStatus.MATCHED.value
-    finally:
-        db.close()
 
 def update_application_status(job_match_id, new_status, notes=None):
     """
@@ -25,36 +23,30 @@ def update_application_status(job_match_id, new_status, notes=None):
     Returns True on success, False on failure.
     Automatically updates updated_at timestamp.
     """
-    db = JobMatchDatabase()
+    db = get_thread_database()
     try:
         return db.update_application_status(job_match_id, new_status, notes)
     except Exception as e:
         logger.error(f"Error updating application status: {e}")
         return False
-    finally:
-        db.close()
 
 def add_application_note(job_match_id, note):
     """Add or append a note to an application."""
-    db = JobMatchDatabase()
+    db = get_thread_database()
     try:
         return db.add_application_note(job_match_id, note)
     except Exception as e:
         logger.error(f"Error adding application note: {e}")
         return False
-    finally:
-        db.close()
 
 def get_application_by_job_match_id(job_match_id):
     """Get full application record."""
-    db = JobMatchDatabase()
+    db = get_thread_database()
     try:
         return db.get_application_by_job_match_id(job_match_id)
     except Exception as e:
         logger.error(f"Error getting application: {e}")
         return None
-    finally:
-        db.close()
 
 def get_application_pipeline_stats(cv_key=None):
     """
@@ -64,9 +56,8 @@ def get_application_pipeline_stats(cv_key=None):
     Returns:
         dict: Status counts including TOTAL_ACTIVE, TOTAL_CLOSED, TOTAL_ALL
     """
-    db = JobMatchDatabase()
+    db = get_thread_database()
     try:
-        db.connect()
         cursor = db.conn.cursor()
         
         # Query with LEFT JOIN to include jobs without application records
@@ -129,5 +120,3 @@ def get_application_pipeline_stats(cv_key=None):
             'REJECTED': 0, 'ARCHIVED': 0,
             'TOTAL_ACTIVE': 0, 'TOTAL_CLOSED': 0, 'TOTAL_ALL': 0
         }
-    finally:
-        db.close()
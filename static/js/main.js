@@ -72,71 +72,98 @@ function checkOperationStatus(operationId, onComplete) {
         }
     }
     
-    // Start polling for status updates
-    const pollInterval = setInterval(() => {
-        fetch(statusUrl)
-            .then(response => response.json())
-            .then(data => {
-                if (data.error) {
-                    clearInterval(pollInterval);
-                    updateProgressModal(100, `Error: ${data.error}`);
-                    return;
+    // Apply one status payload ({progress, status} or {error}); returns true once the operation is over
+    function handleStatusUpdate(data) {
+        if (data.error) {
+            updateProgressModal(100, `Error: ${data.error}`);
+            return true;
+        }
+        
+        const progress = data.progress;
+        const status = data.status;
+        
+        // Update the progress modal
+        updateProgressModal(progress, status.message);
+        
+        // Check if the operation is complete
+        if (progress === 100 || status.status === 'completed' || status.status === 'failed') {
+            // Update modal title and message based on operation status
+            const progressModalLabel = document.getElementById('progressModalLabel');
+            const statusMessage = document.getElementById('operationStatusMessage');
+            
+            if (status.status === 'failed') {
+                // Handle failed operations
+                if (progressModalLabel) {
+                    progressModalLabel.textContent = 'Operation Failed';
                 }
-                
-                const progress = data.progress;
-                const status = data.status;
-                
-                // Update the progress modal
-                updateProgressModal(progress, status.message);
-                
-                // Check if the operation is complete
-                if (progress === 100 || status.status === 'completed' || status.status === 'failed') {
-                    clearInterval(pollInterval);
-                    
-                    // Update modal title and message based on operation status
-                    const progressModalLabel = document.getElementById('progressModalLabel');
-                    const statusMessage = document.getElementById('operationStatusMessage');
-                    
-                    if (status.status === 'failed') {
-                        // Handle failed operations
-                        if (progressModalLabel) {
-                            progressModalLabel.textContent = 'Operation Failed';
-                        }
-                        if (statusMessage) {
-                            statusMessage.innerHTML = `${status.message}<br><br><strong>Operation failed.</strong>`;
-                        }
-                        // Change progress bar color to red for failed operations
-                        if (progressBar) {
-                            progressBar.classList.remove('bg-success');
-                            progressBar.classList.add('bg-danger');
-                        }
-                    } else if (status.status === 'completed') {
-                        // Handle completed operations
-                        if (progressModalLabel) {
-                            progressModalLabel.textContent = 'Operation Completed';
-                        }
-                        // Change progress bar color to green for completed operations
-                        if (progressBar) {
-                            progressBar.classList.remove('bg-danger');
-                            progressBar.classList.add('bg-success');
-                        }
-                    }
-                    
-                    // Call the onComplete callback if provided
-                    if (onComplete && typeof onComplete === 'function') {
-                        onComplete(status);
-                    }
+                if (statusMessage) {
+                    statusMessage.innerHTML = `${status.message}<br><br><strong>Operation failed.</strong>`;
                 }
-            })
-            .catch(error => {
-                console.error('Error checking operation status:', error);
-                clearInterval(pollInterval);
-                updateProgressModal(100, `Error checking status: ${error.message}`);
-            });
-    }, 1000); // Poll every second
-    
-    // Return the poll interval so it can be cleared if needed
-    return pollInterval;
+                // Change progress bar color to red for failed operations
+                if (progressBar) {
+                    progressBar.classList.remove('bg-success');
+                    progressBar.classList.add('bg-danger');
+                }
+            } else if (status.status === 'completed') {
+                // Handle completed operations
+                if (progressModalLabel) {
+                    progressModalLabel.textContent = 'Operation Completed';
+                }
+                // Change progress bar color to green for completed operations
+                if (progressBar) {
+                    progressBar.classList.remove('bg-danger');
+                    progressBar.classList.add('bg-success');
+                }
+            }
+            
+            // Call the onComplete callback if provided
+            if (onComplete && typeof onComplete === 'function') {
+                onComplete(status);
+            }
+            return true;
+        }
+        return false;
+    }
+
+    // Poll /operation_status once a second (used when server-sent events are unavailable)
+    function startPolling() {
+        const pollInterval = setInterval(() => {
+            fetch(statusUrl)
+                .then(response => response.json())
+                .then(data => {
+                    if (handleStatusUpdate(data)) {
+                        clearInterval(pollInterval);
+                    }
+                })
+                .catch(error => {
+                    console.error('Error checking operation status:', error);
+                    clearInterval(pollInterval);
+                    updateProgressModal(100, `Error checking status: ${error.message}`);
+                });
+        }, 1000); // Poll every second
+        return pollInterval;
+    }
+
+    // Prefer the pushed event stream; if it can't be opened or drops before the
+    // operation is over, continue with polling
+    if (!window.EventSource) {
+        return startPolling();
+    }
+    let finished = false;
+    const events = new EventSource(`/operation_events/${operationId}`);
+    events.onmessage = (event) => {
+        if (handleStatusUpdate(JSON.parse(event.data))) {
+            finished = true;
+            events.close();
+        }
+    };
+    events.onerror = () => {
+        events.close();
+        if (!finished) {
+            startPolling();
+        }
+    };
+    return events;
 }
 
 // Main DOMContentLoaded listener
@@ -656,6 +683,14 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 console.log("Backend response:", data); // Log response for debugging
                 let message = `Generated ${data.success_count}/${jobUrls.length} letters.`;
+                if (data.skipped && data.skipped.length > 0) {
+                    // Name the skipped jobs so users know which folders to delete to regenerate them
+                    const skippedTitles = data.skipped.map(skippedUrl => {
+                        const index = jobUrls.indexOf(skippedUrl);
+                        return index !== -1 ? jobTitles[index] : skippedUrl;
+                    });
+                    message += ` Skipped (letter already exists): ${skippedTitles.join(', ')}.`;
+                }
                 if (data.errors && data.errors.length > 0) {
                     // Find job titles for failed URLs
                     const failedTitles = data.errors.map(errorUrl => {
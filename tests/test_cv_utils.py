@@ -0,0 +1,58 @@
+"""
+Tests for the cached CV summary reader in utils.cv_utils.
+"""
+
+import os
+
+import pytest
+
+from utils import cv_utils
+from utils.cv_utils import load_cv_summary
+
+
+@pytest.fixture
+def summary_file(tmp_path):
+    """
+    Write a CV summary file and start from an empty summary cache.
+
+    Yields:
+        Path: The summary file
+    """
+    cv_utils._read_cv_summary.cache_clear()
+    path = tmp_path / 'Lebenslauf_summary.txt'
+    path.write_text('Python developer with 5 years of experience', encoding='utf-8')
+    yield path
+    cv_utils._read_cv_summary.cache_clear()
+
+
+class TestLoadCvSummary:
+    """load_cv_summary reads a file once and rereads it after it changes."""
+
+    def test_unchanged_file_is_served_from_cache(self, summary_file):
+        assert load_cv_summary(summary_file) == 'Python developer with 5 years of experience'
+        assert load_cv_summary(str(summary_file)) == 'Python developer with 5 years of experience'
+
+        info = cv_utils._read_cv_summary.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_mtime_change_invalidates_entry(self, summary_file):
+        load_cv_summary(summary_file)
+        summary_file.write_text('Python developer with 6 years of experience', encoding='utf-8')
+        st = summary_file.stat()
+        os.utime(summary_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert load_cv_summary(summary_file) == 'Python developer with 6 years of experience'
+
+    def test_size_change_with_same_mtime_invalidates_entry(self, summary_file):
+        load_cv_summary(summary_file)
+        st = summary_file.stat()
+        # Coarse filesystem timestamps can leave the mtime unchanged after a rewrite
+        summary_file.write_text('Senior Python developer', encoding='utf-8')
+        os.utime(summary_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert load_cv_summary(summary_file) == 'Senior Python developer'
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_cv_summary(tmp_path / 'missing_summary.txt')
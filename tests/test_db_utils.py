@@ -0,0 +1,216 @@
+"""
+Tests for JobMatchDatabase batch writes, status promotion and operation state.
+"""
+
+import json
+import time
+
+import pytest
+
+from utils.db_utils import JobMatchDatabase
+
+
+@pytest.fixture
+def job_db(tmp_path):
+    """
+    Create a JobMatchDatabase with the full schema in a temporary directory.
+
+    Yields:
+        JobMatchDatabase: Connected database
+    """
+    db = JobMatchDatabase(str(tmp_path / 'jobsearchai.db'))
+    db.init_database()
+    yield db
+    db.close()
+
+
+def make_match(job_url, **overrides):
+    """Build a job match record in the shape insert_job_match(es) expects."""
+    match = {
+        'job_url': job_url,
+        'search_term': 'python',
+        'cv_key': 'cv-1',
+        'job_title': 'Software Engineer',
+        'company_name': 'TechCorp AG',
+        'overall_match': 7,
+        'scraped_data': json.dumps({'Job Title': 'Software Engineer'}),
+        'scraped_at': '2025-10-15T10:00:00',
+    }
+    match.update(overrides)
+    return match
+
+
+def count_matches(db):
+    """Number of rows in job_matches."""
+    return db.conn.execute('SELECT COUNT(*) FROM job_matches').fetchone()[0]
+
+
+class TestInsertJobMatches:
+    """insert_job_matches writes a batch in one transaction and skips duplicates."""
+
+    def test_inserts_every_record(self, job_db):
+        row_ids = job_db.insert_job_matches([
+            make_match('https://www.ostjob.ch/job/a/1'),
+            make_match('https://www.ostjob.ch/job/b/2'),
+        ])
+
+        assert len(row_ids) == 2
+        assert None not in row_ids
+        assert row_ids[0] != row_ids[1]
+        assert job_db.job_exists('https://www.ostjob.ch/job/a/1', 'python', 'cv-1')
+        assert job_db.job_exists('https://www.ostjob.ch/job/b/2', 'python', 'cv-1')
+
+    def test_duplicate_within_batch_is_ignored(self, job_db):
+        row_ids = job_db.insert_job_matches([
+            make_match('https://www.ostjob.ch/job/a/1'),
+            make_match('https://www.ostjob.ch/job/a/1', overall_match=9),
+            make_match('https://www.ostjob.ch/job/b/2'),
+        ])
+
+        assert row_ids[0] is not None
+        assert row_ids[1] is None
+        assert row_ids[2] is not None
+        assert count_matches(job_db) == 2
+        # The first record wins; INSERT OR IGNORE doesn't overwrite it
+        stored = job_db.conn.execute(
+            'SELECT overall_match FROM job_matches WHERE id = ?', (row_ids[0],)
+        ).fetchone()[0]
+        assert stored == 7
+
+    def test_rows_already_stored_are_ignored(self, job_db):
+        existing_id = job_db.insert_job_match(make_match('https://www.ostjob.ch/job/a/1'))
+
+        row_ids = job_db.insert_job_matches([
+            make_match('https://www.ostjob.ch/job/a/1'),
+            make_match('https://www.ostjob.ch/job/b/2'),
+        ])
+
+        assert existing_id is not None
+        assert row_ids[0] is None
+        assert row_ids[1] is not None
+        assert count_matches(job_db) == 2
+
+    def test_relative_and_absolute_urls_are_the_same_job(self, job_db):
+        row_ids = job_db.insert_job_matches([
+            make_match('/job/a/1'),
+            make_match('https://www.ostjob.ch/job/a/1'),
+        ])
+
+        assert row_ids[0] is not None
+        assert row_ids[1] is None
+
+    def test_same_url_for_another_cv_is_kept(self, job_db):
+        row_ids = job_db.insert_job_matches([
+            make_match('https://www.ostjob.ch/job/a/1'),
+            make_match('https://www.ostjob.ch/job/a/1', cv_key='cv-2'),
+        ])
+
+        assert None not in row_ids
+        assert count_matches(job_db) == 2
+
+    def test_empty_batch(self, job_db):
+        assert job_db.insert_job_matches([]) == []
+        assert count_matches(job_db) == 0
+
+    def test_failed_batch_keeps_nothing(self, job_db):
+        incomplete = make_match('https://www.ostjob.ch/job/b/2')
+        del incomplete['overall_match']
+
+        with pytest.raises(KeyError):
+            job_db.insert_job_matches([make_match('https://www.ostjob.ch/job/a/1'), incomplete])
+
+        assert count_matches(job_db) == 0
+        assert not job_db.conn.in_transaction
+
+
+class TestPromoteApplicationStatuses:
+    """promote_application_statuses upserts applications for early-stage jobs only."""
+
+    @pytest.fixture
+    def match_ids(self, job_db):
+        """Store three matches for cv-1 and return their IDs by URL."""
+        urls = [
+            'https://www.ostjob.ch/job/a/1',
+            'https://www.ostjob.ch/job/b/2',
+            'https://www.ostjob.ch/job/c/3',
+        ]
+        row_ids = job_db.insert_job_matches([make_match(url) for url in urls])
+        return dict(zip(urls, row_ids))
+
+    def test_creates_application_for_job_without_one(self, job_db, match_ids):
+        promoted = job_db.promote_application_statuses(['https://www.ostjob.ch/job/a/1'], 'cv-1', 'PREPARING')
+
+        assert promoted == 1
+        assert job_db.get_application_status(match_ids['https://www.ostjob.ch/job/a/1']) == 'PREPARING'
+
+    def test_promotes_matched_and_interested(self, job_db, match_ids):
+        job_db.update_application_status(match_ids['https://www.ostjob.ch/job/a/1'], 'MATCHED')
+        job_db.update_application_status(match_ids['https://www.ostjob.ch/job/b/2'], 'INTERESTED')
+
+        promoted = job_db.promote_application_statuses(
+            ['https://www.ostjob.ch/job/a/1', 'https://www.ostjob.ch/job/b/2'], 'cv-1', 'PREPARING'
+        )
+
+        assert promoted == 2
+        assert job_db.get_application_status(match_ids['https://www.ostjob.ch/job/a/1']) == 'PREPARING'
+        assert job_db.get_application_status(match_ids['https://www.ostjob.ch/job/b/2']) == 'PREPARING'
+
+    def test_later_statuses_are_left_alone(self, job_db, match_ids):
+        job_db.update_application_status(match_ids['https://www.ostjob.ch/job/c/3'], 'APPLIED')
+
+        promoted = job_db.promote_application_statuses(['https://www.ostjob.ch/job/c/3'], 'cv-1', 'PREPARING')
+
+        assert promoted == 0
+        assert job_db.get_application_status(match_ids['https://www.ostjob.ch/job/c/3']) == 'APPLIED'
+
+    def test_unknown_url_and_other_cv_create_nothing(self, job_db, match_ids):
+        promoted = job_db.promote_application_statuses(
+            ['https://www.ostjob.ch/job/unknown/9'], 'cv-1', 'PREPARING'
+        ) + job_db.promote_application_statuses(
+            ['https://www.ostjob.ch/job/a/1'], 'cv-2', 'PREPARING'
+        )
+
+        assert promoted == 0
+        assert job_db.conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0] == 0
+
+    def test_relative_url_is_normalized(self, job_db, match_ids):
+        promoted = job_db.promote_application_statuses(['/job/a/1'], 'cv-1', 'PREPARING')
+
+        assert promoted == 1
+        assert job_db.get_application_status(match_ids['https://www.ostjob.ch/job/a/1']) == 'PREPARING'
+
+    def test_invalid_status_is_rejected(self, job_db, match_ids):
+        assert job_db.promote_application_statuses(['https://www.ostjob.ch/job/a/1'], 'cv-1', 'BOGUS') == 0
+        assert job_db.conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0] == 0
+
+
+class TestOperations:
+    """Background operation state survives in the operations table."""
+
+    def test_save_and_get_round_trip(self, job_db):
+        job_db.save_operation('op-1', 40, {'status': 'processing', 'message': 'Scraping'})
+
+        assert job_db.get_operation('op-1') == (40, {'status': 'processing', 'message': 'Scraping'})
+
+    def test_save_overwrites_previous_state(self, job_db):
+        job_db.save_operation('op-1', 40, {'status': 'processing'})
+        job_db.save_operation('op-1', 100, {'status': 'completed'})
+
+        assert job_db.get_operation('op-1') == (100, {'status': 'completed'})
+        assert job_db.conn.execute('SELECT COUNT(*) FROM operations').fetchone()[0] == 1
+
+    def test_unknown_operation(self, job_db):
+        assert job_db.get_operation('missing') is None
+
+    def test_purge_removes_only_stale_operations(self, job_db):
+        job_db.save_operation('old', 100, {'status': 'completed'})
+        job_db.save_operation('new', 10, {'status': 'processing'})
+        job_db.conn.execute(
+            'UPDATE operations SET updated_at = ? WHERE operation_id = ?',
+            (time.time() - 7200, 'old')
+        )
+        job_db.conn.commit()
+
+        assert job_db.purge_operations(3600) == 1
+        assert job_db.get_operation('old') is None
+        assert job_db.get_operation('new') == (10, {'status': 'processing'})
@@ -0,0 +1,97 @@
+"""
+Tests for atomic file writes in utils.file_utils.
+"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from utils import file_utils
+from utils.file_utils import atomic_write_bytes, save_json_file
+
+
+def leftover_temp_files(directory):
+    """Temporary files atomic_write_bytes left behind in a directory."""
+    return [p.name for p in directory.iterdir() if p.name.startswith('.') and p.name.endswith('.tmp')]
+
+
+def failing_replace(src, dst):
+    """Stand-in for os.replace that fails like a full disk."""
+    raise OSError('disk full')
+
+
+class TestAtomicWriteBytes:
+    """atomic_write_bytes replaces a file in one step and cleans up after itself."""
+
+    def test_creates_new_file(self, tmp_path):
+        target = tmp_path / 'data.json'
+
+        atomic_write_bytes(target, b'{"a": 1}')
+
+        assert target.read_bytes() == b'{"a": 1}'
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+        assert leftover_temp_files(tmp_path) == []
+
+    def test_replaces_existing_file(self, tmp_path):
+        target = tmp_path / 'data.json'
+        target.write_bytes(b'old contents that are longer than the new ones')
+
+        atomic_write_bytes(target, b'new')
+
+        assert target.read_bytes() == b'new'
+        assert leftover_temp_files(tmp_path) == []
+
+    def test_keeps_existing_permissions(self, tmp_path):
+        target = tmp_path / 'data.json'
+        target.write_bytes(b'old')
+        os.chmod(target, 0o600)
+
+        atomic_write_bytes(target, b'new')
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+    def test_data_is_fsynced_before_replace(self, tmp_path, monkeypatch):
+        target = tmp_path / 'data.json'
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+        monkeypatch.setattr(file_utils.os, 'fsync', lambda fd: (calls.append('fsync'), real_fsync(fd)))
+        monkeypatch.setattr(file_utils.os, 'replace', lambda src, dst: (calls.append('replace'), real_replace(src, dst)))
+
+        atomic_write_bytes(target, b'new')
+
+        assert calls == ['fsync', 'replace']
+
+    def test_failed_replace_keeps_old_file_and_removes_temp(self, tmp_path, monkeypatch):
+        target = tmp_path / 'data.json'
+        target.write_bytes(b'old')
+        monkeypatch.setattr(file_utils.os, 'replace', failing_replace)
+
+        with pytest.raises(OSError):
+            atomic_write_bytes(target, b'new')
+
+        assert target.read_bytes() == b'old'
+        assert leftover_temp_files(tmp_path) == []
+
+
+class TestSaveJsonFile:
+    """save_json_file writes through atomic_write_bytes."""
+
+    def test_round_trip(self, tmp_path):
+        target = tmp_path / 'nested' / 'data.json'
+
+        assert save_json_file({'Job Title': 'Softwareentwickler'}, target) is True
+
+        assert json.loads(target.read_text(encoding='utf-8')) == {'Job Title': 'Softwareentwickler'}
+        assert leftover_temp_files(target.parent) == []
+
+    def test_failure_returns_false_and_keeps_old_file(self, tmp_path, monkeypatch):
+        target = tmp_path / 'data.json'
+        target.write_text('{"old": true}', encoding='utf-8')
+        monkeypatch.setattr(file_utils.os, 'replace', failing_replace)
+
+        assert save_json_file({'new': True}, target) is False
+
+        assert json.loads(target.read_text(encoding='utf-8')) == {'old': True}
+        assert leftover_temp_files(tmp_path) == []
@@ -0,0 +1,105 @@
+"""
+Tests for the live-fetched job details cache in get_job_details.
+"""
+
+import time
+
+import pytest
+
+import job_details_utils
+from config import config
+from utils.db_utils import JobMatchDatabase
+
+
+JOB_URL = 'https://www.ostjob.ch/job/software-engineer/1'
+
+
+@pytest.fixture
+def details_db(tmp_path, monkeypatch):
+    """
+    Route the job details cache to a temporary database.
+
+    Yields:
+        JobMatchDatabase: Database holding the job_details_cache table
+    """
+    db = JobMatchDatabase(str(tmp_path / 'jobsearchai.db'))
+    db.init_job_details_cache_table()
+    monkeypatch.setattr(job_details_utils, '_get_job_details_cache_db', lambda: db)
+    monkeypatch.setitem(config.DEFAULTS['scraper'], 'details_cache_ttl_seconds', 3600)
+    # Failed live fetches must not be masked by whatever scraped data is on disk
+    monkeypatch.setattr(job_details_utils, 'get_job_details_from_scraped_data', lambda job_url: None)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def live_fetch(monkeypatch):
+    """
+    Replace the live scraper with a fake that counts its calls.
+
+    Set ``live_fetch.result`` to None to simulate a failed fetch.
+    """
+    def fake_fetch(job_url):
+        fake_fetch.calls += 1
+        return dict(fake_fetch.result) if fake_fetch.result else None
+
+    fake_fetch.calls = 0
+    fake_fetch.result = {
+        'Job Title': 'Software Engineer',
+        'Company Name': 'TechCorp AG',
+        'Application URL': JOB_URL,
+    }
+    monkeypatch.setattr(job_details_utils, 'get_job_details_with_graphscrapeai', fake_fetch, raising=False)
+    return fake_fetch
+
+
+class TestJobDetailsCache:
+    """get_job_details reuses fresh live-fetched details unless asked to refresh."""
+
+    def test_second_call_is_served_from_cache(self, details_db, live_fetch):
+        first = job_details_utils.get_job_details(JOB_URL)
+        second = job_details_utils.get_job_details(JOB_URL)
+
+        assert live_fetch.calls == 1
+        assert first == second
+        assert second['Job Title'] == 'Software Engineer'
+
+    def test_refresh_fetches_again_and_updates_cache(self, details_db, live_fetch):
+        job_details_utils.get_job_details(JOB_URL)
+        live_fetch.result = dict(live_fetch.result, **{'Job Title': 'Senior Software Engineer'})
+
+        refreshed = job_details_utils.get_job_details(JOB_URL, refresh=True)
+        cached = job_details_utils.get_job_details(JOB_URL)
+
+        assert live_fetch.calls == 2
+        assert refreshed['Job Title'] == 'Senior Software Engineer'
+        assert cached['Job Title'] == 'Senior Software Engineer'
+
+    def test_failed_fetch_is_not_cached(self, details_db, live_fetch):
+        live_fetch.result = None
+
+        details = job_details_utils.get_job_details(JOB_URL)
+
+        assert details['Job Title'] == 'Unknown_Job'
+        assert details_db.get_cached_job_details(JOB_URL, 3600) is None
+
+        # The next call tries the live fetch again
+        job_details_utils.get_job_details(JOB_URL)
+        assert live_fetch.calls == 2
+
+    def test_zero_ttl_disables_cache(self, details_db, live_fetch, monkeypatch):
+        monkeypatch.setitem(config.DEFAULTS['scraper'], 'details_cache_ttl_seconds', 0)
+
+        job_details_utils.get_job_details(JOB_URL)
+        job_details_utils.get_job_details(JOB_URL)
+
+        assert live_fetch.calls == 2
+        assert details_db.get_cached_job_details(JOB_URL, 3600) is None
+
+    def test_stale_entry_is_ignored(self, details_db):
+        details_db.save_cached_job_details(JOB_URL, '{"Job Title": "Software Engineer"}')
+        details_db.conn.execute('UPDATE job_details_cache SET fetched_at = ?', (time.time() - 7200,))
+        details_db.conn.commit()
+
+        assert details_db.get_cached_job_details(JOB_URL, 3600) is None
+        assert details_db.get_cached_job_details(JOB_URL, 10800) is not None
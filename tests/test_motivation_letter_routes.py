@@ -0,0 +1,155 @@
+"""
+Tests for the file-backed helpers in blueprints.motivation_letter_routes.
+"""
+
+import os
+
+import pytest
+from flask import Flask, flash
+from flask_login import LoginManager
+
+from blueprints import motivation_letter_routes as routes
+
+
+def rewrite_keeping_mtime(path, text):
+    """Rewrite a file and restore its mtime, as a coarse-timestamp filesystem would."""
+    st = path.stat()
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+class TestLoadLetterHtml:
+    """load_letter_html serves unchanged letters from memory and rereads edited ones."""
+
+    @pytest.fixture
+    def letter_html(self, tmp_path):
+        routes._read_letter_html.cache_clear()
+        path = tmp_path / 'bewerbungsschreiben.html'
+        path.write_text('<p>Sehr geehrte Damen und Herren</p>', encoding='utf-8')
+        yield path
+        routes._read_letter_html.cache_clear()
+
+    def test_unchanged_file_is_served_from_cache(self, letter_html):
+        assert routes.load_letter_html(letter_html) == '<p>Sehr geehrte Damen und Herren</p>'
+        assert routes.load_letter_html(str(letter_html)) == '<p>Sehr geehrte Damen und Herren</p>'
+
+        info = routes._read_letter_html.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_regenerated_letter_is_reread(self, letter_html):
+        routes.load_letter_html(letter_html)
+        letter_html.write_text('<p>Liebes Team</p>', encoding='utf-8')
+        st = letter_html.stat()
+        os.utime(letter_html, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert routes.load_letter_html(letter_html) == '<p>Liebes Team</p>'
+
+    def test_size_change_with_same_mtime_is_reread(self, letter_html):
+        routes.load_letter_html(letter_html)
+        rewrite_keeping_mtime(letter_html, '<p>Hallo</p>')
+
+        assert routes.load_letter_html(letter_html) == '<p>Hallo</p>'
+
+
+class TestLoadLetterJson:
+    """load_letter_json parses a file once and reparses it after it is rewritten."""
+
+    @pytest.fixture
+    def letter_json(self, tmp_path):
+        routes._read_letter_json.cache_clear()
+        path = tmp_path / 'letter.json'
+        routes.save_json_file({'subject': 'Bewerbung als Software Engineer'}, path)
+        yield path
+        routes._read_letter_json.cache_clear()
+
+    def test_unchanged_file_is_served_from_cache(self, letter_json):
+        first = routes.load_letter_json(letter_json)
+        second = routes.load_letter_json(letter_json)
+
+        assert first == {'subject': 'Bewerbung als Software Engineer'}
+        assert second is first
+        assert routes._read_letter_json.cache_info().misses == 1
+
+    def test_rewrite_through_save_json_file_is_reparsed(self, letter_json):
+        routes.load_letter_json(letter_json)
+        routes.save_json_file({'subject': 'Bewerbung als Senior Software Engineer'}, letter_json)
+        st = letter_json.stat()
+        os.utime(letter_json, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert routes.load_letter_json(letter_json) == {'subject': 'Bewerbung als Senior Software Engineer'}
+
+    def test_size_change_with_same_mtime_is_reparsed(self, letter_json):
+        routes.load_letter_json(letter_json)
+        rewrite_keeping_mtime(letter_json, '{"subject": "Bewerbung"}')
+
+        assert routes.load_letter_json(letter_json) == {'subject': 'Bewerbung'}
+
+
+class TestFileViewEtag:
+    """File-backed views answer revalidation with 304 while the file is unchanged."""
+
+    @pytest.fixture
+    def view_app(self, tmp_path):
+        """Minimal app with a login manager and a one-line template."""
+        (tmp_path / 'view.html').write_text('{{ text }}', encoding='utf-8')
+        app = Flask(__name__, template_folder=str(tmp_path))
+        app.config.update({'TESTING': True, 'SECRET_KEY': 'test-secret-key'})
+        login_manager = LoginManager(app)
+        login_manager.user_loader(lambda user_id: None)
+        return app
+
+    @pytest.fixture
+    def viewed_file(self, tmp_path):
+        path = tmp_path / 'job_data.json'
+        path.write_text('{"Job Title": "Software Engineer"}', encoding='utf-8')
+        return path
+
+    def test_etag_is_stable_for_unchanged_file(self, view_app, viewed_file):
+        with view_app.test_request_context('/view?file=job_data.json'):
+            assert routes.file_view_etag(viewed_file) == routes.file_view_etag(viewed_file)
+
+    def test_etag_changes_with_file_and_query(self, view_app, viewed_file):
+        with view_app.test_request_context('/view?file=job_data.json'):
+            etag = routes.file_view_etag(viewed_file)
+            rewrite_keeping_mtime(viewed_file, '{"Job Title": "Senior Software Engineer"}')
+            assert routes.file_view_etag(viewed_file) != etag
+
+        with view_app.test_request_context('/view?file=other.json'):
+            assert routes.file_view_etag(viewed_file) != etag
+
+    def test_matching_if_none_match_is_not_modified(self, view_app, viewed_file):
+        with view_app.test_request_context('/view'):
+            etag = routes.file_view_etag(viewed_file)
+
+        with view_app.test_request_context('/view', headers={'If-None-Match': f'"{etag}"'}):
+            assert routes.is_not_modified(etag)
+            assert not routes.is_not_modified('stale-etag')
+
+    def test_pending_flash_forces_full_render(self, view_app, viewed_file):
+        with view_app.test_request_context('/view'):
+            etag = routes.file_view_etag(viewed_file)
+
+        with view_app.test_request_context('/view', headers={'If-None-Match': f'"{etag}"'}):
+            flash('Letter regenerated', 'success')
+            assert not routes.is_not_modified(etag)
+
+    def test_render_file_view_sets_private_revalidatable_etag(self, view_app):
+        with view_app.test_request_context('/view'):
+            response = routes.render_file_view('abc123', 'view.html', text='Software Engineer')
+
+        assert response.status_code == 200
+        assert response.get_data(as_text=True) == 'Software Engineer'
+        assert response.get_etag() == ('abc123', False)
+        assert response.cache_control.private
+        assert response.cache_control.no_cache
+
+    def test_not_modified_response(self, view_app):
+        with view_app.test_request_context('/view'):
+            response = routes.not_modified_response('abc123')
+
+        assert response.status_code == 304
+        assert response.get_data() == b''
+        assert response.get_etag() == ('abc123', False)
+        assert response.cache_control.private
+        assert response.cache_control.no_cache
@@ -0,0 +1,102 @@
+"""
+Tests for the /operation_events server-sent events stream in dashboard.py.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def dashboard_app(tmp_path, monkeypatch):
+    """
+    Create the dashboard app with its databases and upload folder in a temporary directory.
+
+    Yields:
+        Flask: Dashboard application with login disabled
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'users.db'}")
+    from dashboard import create_app
+
+    app = create_app()
+    app.config.update({'TESTING': True, 'LOGIN_DISABLED': True})
+    yield app
+    app.extensions['letter_executor'].shutdown(wait=False)
+
+
+def read_events(response):
+    """Decode the data events of an SSE response."""
+    return [
+        json.loads(line[len('data: '):])
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith('data: ')
+    ]
+
+
+class TestOperationEvents:
+    """The stream pushes operation state and ends once the operation finishes."""
+
+    def test_unknown_operation_is_404(self, dashboard_app):
+        response = dashboard_app.test_client().get('/operation_events/missing')
+
+        assert response.status_code == 404
+
+    def test_completed_operation_sends_final_state(self, dashboard_app):
+        operation_id = dashboard_app.extensions['start_operation']('letter_generation')
+        dashboard_app.extensions['complete_operation'](operation_id, message='Letter ready')
+
+        response = dashboard_app.test_client().get(f'/operation_events/{operation_id}')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        assert response.headers['Cache-Control'] == 'no-cache'
+        events = read_events(response)
+        assert len(events) == 1
+        assert events[0]['progress'] == 100
+        assert events[0]['status']['status'] == 'completed'
+        assert events[0]['status']['message'] == 'Letter ready'
+
+    def test_stream_follows_updates_until_completion(self, dashboard_app):
+        extensions = dashboard_app.extensions
+        operation_id = extensions['start_operation']('letter_generation')
+
+        def worker():
+            time.sleep(0.1)
+            extensions['update_operation_progress'](operation_id, 50, status='processing', message='Writing letter')
+            time.sleep(0.1)
+            extensions['complete_operation'](operation_id)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        response = dashboard_app.test_client().get(f'/operation_events/{operation_id}')
+        thread.join()
+
+        events = read_events(response)
+        assert events[0]['progress'] == 0
+        assert events[0]['status']['status'] == 'starting'
+        assert events[-1]['progress'] == 100
+        assert events[-1]['status']['status'] == 'completed'
+
+    def test_operation_from_before_a_reload_sends_one_event(self, dashboard_app):
+        from dashboard import create_app
+
+        extensions = dashboard_app.extensions
+        operation_id = extensions['start_operation']('job_matching')
+        extensions['update_operation_progress'](operation_id, 30, status='processing', message='Matching')
+        # A reloaded worker only knows the operation from SQLite; nothing will update it
+        reloaded_app = create_app()
+        reloaded_app.config.update({'TESTING': True, 'LOGIN_DISABLED': True})
+
+        try:
+            response = reloaded_app.test_client().get(f'/operation_events/{operation_id}')
+        finally:
+            reloaded_app.extensions['letter_executor'].shutdown(wait=False)
+
+        events = read_events(response)
+        assert len(events) == 1
+        # The 30% update came within OPERATION_PERSIST_INTERVAL_SECONDS of the start, so it was not written
+        assert events[0]['progress'] == 0
+        assert events[0]['status']['type'] == 'job_matching'
@@ -7,12 +7,15 @@ particularly OpenAI API operations which are used across the application.
 
 import json
 import time
+import hashlib
+import threading
 from typing import Any, Dict, List, Optional, Union, cast, Literal
 
 import openai
 
 from config import config, get_openai_api_key, get_openai_defaults
 from utils.decorators import handle_exceptions, retry, cache_result
+from utils.db_utils import get_thread_database
 
 # Type hints for new GPT-5.1 parameters
 ReasoningEffort = Literal["none", "low", "medium", "high"]
@@ -50,6 +53,11 @@ class OpenAIClient:
         # Get default parameters
         self.defaults = get_openai_defaults()
         
+        # Shared by every thread using the singleton, so bulk requests can't exceed the rate limit
+        self._request_slots = threading.BoundedSemaphore(
+            config.get_default("openai", "max_concurrent_requests", 8)
+        )
+        
         # Initialize client
         if self.api_key:
             try:
@@ -226,7 +234,8 @@ class OpenAIClient:
         request_params.update(kwargs)
         
         # Make the API call
-        response = self.client.chat.completions.create(**request_params)
+        with self._request_slots:
+            response = self.client.chat.completions.create(**request_params)
         
         # Check if caller wants detailed usage info
         return_usage = kwargs.get("return_usage", False)
@@ -397,11 +406,42 @@ class OpenAIClient:
 # Global OpenAI client instance
 openai_client = OpenAIClient()
 
+# Stored generation results older than this are ignored and purged
+GENERATION_CACHE_TTL_SECONDS = config.get_default("openai", "generation_cache_ttl_seconds", 7 * 24 * 60 * 60)
+
+# The generation_cache table is created (and purged of expired results) on first use, once per process
+_generation_cache_ready = False
+_generation_cache_lock = threading.Lock()
+
+def _get_generation_cache_db():
+    """Return this thread's database with the generation_cache table in place."""
+    global _generation_cache_ready
+    db = get_thread_database()
+    if not _generation_cache_ready:
+        with _generation_cache_lock:
+            if not _generation_cache_ready:
+                db.init_generation_cache_table()
+                purged = db.purge_generation_cache(GENERATION_CACHE_TTL_SECONDS)
+                if purged:
+                    logger.info(f"Purged {purged} expired generation result(s)")
+                _generation_cache_ready = True
+    return db
+
+def _generation_cache_key(prompt: str, system_prompt: str) -> str:
+    """Hash the model and both prompts into the key of a stored generation result."""
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (str(openai_client.defaults.get("model") or ""), system_prompt, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 # Helper functions for common operations
 def generate_json_from_prompt(
     prompt: str,
     system_prompt: str = "You are a helpful assistant that returns structured data.",
-    default: Optional[Dict[str, Any]] = None
+    default: Optional[Dict[str, Any]] = None,
+    persistent_cache: bool = False,
+    refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Generate JSON from a prompt with error handling.
@@ -410,6 +450,11 @@ def generate_json_from_prompt(
         prompt: The prompt text
         system_prompt: System message to set the context
         default: Default value to return if generation fails
+        persistent_cache: Reuse results stored in the SQLite generation cache for
+                          the same model and prompts (up to the openai
+                          generation_cache_ttl_seconds), and store new ones there.
+                          Only for deterministic extraction, not for creative output
+        refresh: Ignore cached results (in memory and SQLite) and replace them
         
     Returns:
         Generated JSON object, or default if generation fails
@@ -421,14 +466,33 @@ def generate_json_from_prompt(
             default={"error": "Failed to extract job details"}
         )
     """
+    cache_key = None
+    if persistent_cache:
+        cache_key = _generation_cache_key(prompt, system_prompt)
+        if not refresh:
+            try:
+                cached = _get_generation_cache_db().get_cached_generation(cache_key, GENERATION_CACHE_TTL_SECONDS)
+                if cached is not None:
+                    logger.info("Using stored generation result (no API call)")
+                    return json.loads(cached)
+            except Exception as e:
+                logger.warning(f"Generation cache lookup failed: {e}")
+    
     result = openai_client.generate_structured_output(
         prompt=prompt,
-        system_prompt=system_prompt
+        system_prompt=system_prompt,
+        refresh_cache=refresh
     )
     
     if result is None:
         return default or {}
     
+    if cache_key:
+        try:
+            _get_generation_cache_db().save_cached_generation(cache_key, json.dumps(result, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"Failed to store generation result: {e}")
+    
     return result
 
 def summarize_cv(
@@ -8,8 +8,10 @@ Part of Epic 2: SQLite Deduplication & Integration Implementation
 Story 2.1: Database Foundation
 """
 
+import os
 import hashlib
 import json
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -19,6 +21,9 @@ import sqlite3
 from utils.logging_config import get_logger
 logger = get_logger("cv_utils")
 
+# Directory (relative to the app root) holding the processed {cv}_summary.txt files
+CV_SUMMARY_DIR = 'process_cv/cv-data/processed'
+
 
 def generate_cv_key(cv_path: str) -> str:
     """
@@ -246,12 +251,51 @@ def validate_cv_file(cv_path: str) -> bool:
         return False
 
 
+def get_cv_summary_path(root_path, cv_name: str) -> Path:
+    """
+    Get the path of the processed summary file for a CV.
+    
+    Args:
+        root_path: Application root directory
+        cv_name: CV base filename (without extension)
+        
+    Returns:
+        Path to {cv_name}_summary.txt below CV_SUMMARY_DIR
+    """
+    return Path(root_path) / CV_SUMMARY_DIR / f"{cv_name}_summary.txt"
+
+
+@functools.lru_cache(maxsize=32)
+def _read_cv_summary(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a CV summary file; cached per (path, mtime, size) so edits invalidate the entry."""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_cv_summary(summary_path) -> str:
+    """
+    Get the text of a CV summary file, served from memory while the file is unchanged.
+    
+    Args:
+        summary_path: Path to the summary file
+        
+    Returns:
+        File content
+        
+    Raises:
+        FileNotFoundError: If the summary file doesn't exist
+    """
+    summary_path = str(summary_path)
+    st = os.stat(summary_path)
+    return _read_cv_summary(summary_path, st.st_mtime_ns, st.st_size)
+
+
 def get_cv_versions(db_conn: Optional[sqlite3.Connection] = None) -> list:
     """
     Get list of all CV versions from database.
     
     Args:
-        db_conn: Optional database connection. If not provided, creates a new connection.
+        db_conn: Optional database connection. If not provided, the calling thread's shared connection is used.
         
     Returns:
         List of tuples (cv_key, file_name, upload_date)
@@ -261,16 +305,11 @@ def get_cv_versions(db_conn: Optional[sqlite3.Connection] = None) -> list:
         >>> for cv_key, name, date in cvs:
         ...     print(f"{name} ({cv_key[:8]}...) uploaded {date}")
     """
-    close_conn = False
-    
     try:
-        # Create connection if not provided
+        # Use this thread's shared connection if none was provided (it stays open)
         if db_conn is None:
-            from utils.db_utils import JobMatchDatabase
-            db = JobMatchDatabase()
-            db.connect()
-            db_conn = db.conn
-            close_conn = True
+            from utils.db_utils import get_thread_database
+            db_conn = get_thread_database().conn
         
         cursor = db_conn.cursor()
         cursor.execute("""
@@ -287,7 +326,3 @@ def get_cv_versions(db_conn: Optional[sqlite3.Connection] = None) -> list:
     except sqlite3.Error as e:
         logger.error(f"Failed to retrieve CV versions: {e}")
         return []
-        
-    finally:
-        if close_conn and db_conn:
-            db_conn.close()
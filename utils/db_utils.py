@@ -10,6 +10,9 @@ Story 2.1: Database Foundation
 
 import sqlite3
 import json
+import time
+import functools
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
@@ -35,14 +38,60 @@ class JobMatchDatabase:
     - Query operations
     """
     
-    # SQLite PRAGMA settings for optimal performance
-    PRAGMA_SETTINGS = {
+    # journal_mode is stored in the database file, so it only needs setting once per
+    # file; switching it also needs a brief exclusive lock, which we avoid repeating
+    PERSISTENT_PRAGMA_SETTINGS = {
         'journal_mode': 'WAL',      # Write-Ahead Logging for better concurrency
+    }
+    _persistent_pragmas_applied: set = set()
+    _persistent_pragmas_lock = threading.Lock()
+    
+    # WAL lets every thread's connection read concurrently but allows one writer;
+    # every write goes through an immediate transaction that takes turns on this
+    # lock instead of polling SQLite's busy handler against other threads
+    _write_lock = threading.RLock()
+    
+    # SQLite PRAGMA settings for optimal performance (per connection)
+    PRAGMA_SETTINGS = {
         'synchronous': 'NORMAL',    # Balance between safety and performance
         'foreign_keys': 'ON',       # Enforce foreign key constraints
         'temp_store': 'MEMORY',     # Use memory for temp tables
+        'mmap_size': 268435456,     # Memory-map up to 256 MB of the database file
+        'cache_size': -64000,       # ~64 MB page cache (negative value = KiB)
     }
     
+    # sqlite3's per-connection compiled statement cache (the default is 128)
+    CACHED_STATEMENTS = 256
+    
+    # Column order for job_matches inserts; the SQL text is constant so SQLite's
+    # statement cache can reuse the compiled statement across calls
+    JOB_MATCH_COLUMNS = (
+        'job_url', 'search_term', 'cv_key', 'job_title', 'company_name',
+        'location', 'posting_date', 'salary_range', 'overall_match',
+        'skills_match', 'experience_match', 'education_fit',
+        'career_trajectory_alignment', 'preference_match',
+        'potential_satisfaction', 'location_compatibility',
+        'reasoning', 'scraped_data', 'scraped_at',
+    )
+    INSERT_JOB_MATCH_SQL = (
+        f"INSERT INTO job_matches ({', '.join(JOB_MATCH_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in JOB_MATCH_COLUMNS)})"
+    )
+    # Batch variant: duplicates are skipped instead of aborting the transaction
+    INSERT_JOB_MATCH_OR_IGNORE_SQL = INSERT_JOB_MATCH_SQL.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+    
+    # Upsert used by promote_application_statuses; {status_placeholders} is filled
+    # once per number of from_statuses (see _promote_applications_sql)
+    PROMOTE_APPLICATIONS_SQL_TEMPLATE = '''
+        INSERT INTO applications (job_match_id, status)
+        SELECT id, ? FROM job_matches
+        WHERE job_url = ? AND cv_key = ?
+        ON CONFLICT(job_match_id) DO UPDATE
+        SET status = excluded.status,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE applications.status IN ({status_placeholders})
+    '''
+    
     def __init__(self, db_path: str = "instance/jobsearchai.db", timeout: float = 30.0):
         """
         Initialize database connection manager.
@@ -80,13 +129,17 @@ class JobMatchDatabase:
             self.conn = sqlite3.connect(
                 self.db_path,
                 timeout=self.timeout,
-                check_same_thread=False  # Allow multi-threaded access
+                check_same_thread=False,  # Allow multi-threaded access
+                # Connections are long-lived per thread, so keep every query's
+                # compiled statement (including chunked IN variants) cached
+                cached_statements=self.CACHED_STATEMENTS
             )
             
             # Enable row factory for dict-like access
             self.conn.row_factory = sqlite3.Row
             
             # Apply PRAGMA settings
+            self._apply_persistent_pragmas(self.conn)
             for pragma, value in self.PRAGMA_SETTINGS.items():
                 self.conn.execute(f"PRAGMA {pragma} = {value}")
             
@@ -97,6 +150,24 @@ class JobMatchDatabase:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
+    def _apply_persistent_pragmas(self, conn: sqlite3.Connection):
+        """
+        Apply file-level PRAGMAs the first time this process opens a database file.
+        
+        Args:
+            conn: Freshly opened connection to self.db_path
+        """
+        db_key = str(Path(self.db_path).resolve())
+        if db_key in self._persistent_pragmas_applied:
+            return
+        
+        with self._persistent_pragmas_lock:
+            if db_key in self._persistent_pragmas_applied:
+                return
+            for pragma, value in self.PERSISTENT_PRAGMA_SETTINGS.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+            self._persistent_pragmas_applied.add(db_key)
+    
     def close(self):
         """Close database connection."""
         if self.conn:
@@ -105,13 +176,22 @@ class JobMatchDatabase:
             logger.info("Database connection closed")
     
     @contextmanager
-    def transaction(self):
+    def transaction(self, immediate: bool = True):
         """
         Context manager for database transactions.
         
+        All write methods of this class use it with the default, so in-process
+        writers are serialized on _write_lock.
+        
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE) so writes
+                from worker threads queue behind each other instead of failing
+                when a deferred read lock cannot be upgraded; pass False only
+                for read-mostly work that can tolerate SQLITE_BUSY
+        
         Usage:
-            with db.transaction():
-                db.insert_job_match(data)
+            with db.transaction() as conn:
+                conn.execute(sql, params)
         """
         if not self.conn:
             self.connect()
@@ -119,12 +199,24 @@ class JobMatchDatabase:
         conn = self.conn
         assert conn is not None, "Database connection not established"
         
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+        if not immediate:
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return
+        
+        with self._write_lock:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
     
     def init_database(self):
         """
@@ -140,98 +232,350 @@ class JobMatchDatabase:
             self.connect()
         
         assert self.conn is not None, "Database connection not established"
-        cursor = self.conn.cursor()
         
         try:
-            # Create job_matches table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS job_matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_url TEXT NOT NULL,
-                    search_term TEXT NOT NULL,
-                    cv_key TEXT NOT NULL,
-                    job_title TEXT,
-                    company_name TEXT,
-                    location TEXT,
-                    posting_date TEXT,
-                    salary_range TEXT,
-                    overall_match INTEGER NOT NULL,
-                    skills_match INTEGER,
-                    experience_match INTEGER,
-                    education_fit INTEGER,
-                    career_trajectory_alignment INTEGER,
-                    preference_match INTEGER,
-                    potential_satisfaction INTEGER,
-                    location_compatibility TEXT,
-                    reasoning TEXT,
-                    scraped_data TEXT NOT NULL,
-                    scraped_at TEXT NOT NULL,
-                    matched_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(job_url, search_term, cv_key)
-                )
-            """)
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                # Create job_matches table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS job_matches (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        job_url TEXT NOT NULL,
+                        search_term TEXT NOT NULL,
+                        cv_key TEXT NOT NULL,
+                        job_title TEXT,
+                        company_name TEXT,
+                        location TEXT,
+                        posting_date TEXT,
+                        salary_range TEXT,
+                        overall_match INTEGER NOT NULL,
+                        skills_match INTEGER,
+                        experience_match INTEGER,
+                        education_fit INTEGER,
+                        career_trajectory_alignment INTEGER,
+                        preference_match INTEGER,
+                        potential_satisfaction INTEGER,
+                        location_compatibility TEXT,
+                        reasoning TEXT,
+                        scraped_data TEXT NOT NULL,
+                        scraped_at TEXT NOT NULL,
+                        matched_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(job_url, search_term, cv_key)
+                    )
+                """)
             
-            # Create cv_versions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS cv_versions (
-                    cv_key TEXT PRIMARY KEY,
-                    file_name TEXT NOT NULL,
-                    file_path TEXT NOT NULL,
-                    file_hash TEXT NOT NULL,
-                    upload_date TEXT DEFAULT CURRENT_TIMESTAMP,
-                    summary TEXT,
-                    metadata TEXT
-                )
-            """)
+                # Create cv_versions table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS cv_versions (
+                        cv_key TEXT PRIMARY KEY,
+                        file_name TEXT NOT NULL,
+                        file_path TEXT NOT NULL,
+                        file_hash TEXT NOT NULL,
+                        upload_date TEXT DEFAULT CURRENT_TIMESTAMP,
+                        summary TEXT,
+                        metadata TEXT
+                    )
+                """)
             
-            # Create scrape_history table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS scrape_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    search_term TEXT NOT NULL,
-                    page_number INTEGER NOT NULL,
-                    jobs_found INTEGER NOT NULL,
-                    new_jobs INTEGER NOT NULL,
-                    duplicate_jobs INTEGER NOT NULL,
-                    scraped_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    duration_seconds REAL
-                )
-            """)
+                # Create scrape_history table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS scrape_history (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        search_term TEXT NOT NULL,
+                        page_number INTEGER NOT NULL,
+                        jobs_found INTEGER NOT NULL,
+                        new_jobs INTEGER NOT NULL,
+                        duplicate_jobs INTEGER NOT NULL,
+                        scraped_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        duration_seconds REAL
+                    )
+                """)
 
-            # Create applications table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_match_id INTEGER NOT NULL UNIQUE,
-                    status TEXT NOT NULL DEFAULT 'MATCHED',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    notes TEXT,
-                    FOREIGN KEY(job_match_id) REFERENCES job_matches(id) ON DELETE CASCADE
-                )
-            """)
+                # Create applications table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS applications (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        job_match_id INTEGER NOT NULL UNIQUE,
+                        status TEXT NOT NULL DEFAULT 'MATCHED',
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        notes TEXT,
+                        FOREIGN KEY(job_match_id) REFERENCES job_matches(id) ON DELETE CASCADE
+                    )
+                """)
+            
+                # Create indexes for query performance
+                indexes = [
+                    "CREATE INDEX IF NOT EXISTS idx_search_term ON job_matches(search_term)",
+                    "CREATE INDEX IF NOT EXISTS idx_cv_key ON job_matches(cv_key)",
+                    "CREATE INDEX IF NOT EXISTS idx_overall_match ON job_matches(overall_match)",
+                    "CREATE INDEX IF NOT EXISTS idx_matched_at ON job_matches(matched_at)",
+                    "CREATE INDEX IF NOT EXISTS idx_location ON job_matches(location)",
+                    "CREATE INDEX IF NOT EXISTS idx_search_cv_match ON job_matches(search_term, cv_key, overall_match)",
+                    "CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)",
+                ]
             
-            # Create indexes for query performance
-            indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_search_term ON job_matches(search_term)",
-                "CREATE INDEX IF NOT EXISTS idx_cv_key ON job_matches(cv_key)",
-                "CREATE INDEX IF NOT EXISTS idx_overall_match ON job_matches(overall_match)",
-                "CREATE INDEX IF NOT EXISTS idx_matched_at ON job_matches(matched_at)",
-                "CREATE INDEX IF NOT EXISTS idx_location ON job_matches(location)",
-                "CREATE INDEX IF NOT EXISTS idx_search_cv_match ON job_matches(search_term, cv_key, overall_match)",
-                "CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)",
-            ]
-            
-            for index_sql in indexes:
-                cursor.execute(index_sql)
-            
-            self.conn.commit()
+                for index_sql in indexes:
+                    cursor.execute(index_sql)
+            
+            self.init_operations_table()
             logger.info("Database schema initialized successfully")
             
         except sqlite3.Error as e:
             logger.error(f"Failed to initialize database schema: {e}")
             raise
     
+    def init_operations_table(self):
+        """
+        Create the operations table used to persist background operation state.
+
+        Safe to call on every startup; the dashboard calls it directly so existing
+        databases pick up the table without re-running init_database().
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS operations (
+                    operation_id TEXT PRIMARY KEY,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    status_json TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_operations_updated_at ON operations(updated_at)"
+            )
+
+    def save_operation(self, operation_id: str, progress: int, status: Dict[str, Any]) -> None:
+        """
+        Insert or update the persisted state of a background operation.
+
+        Args:
+            operation_id: Operation UUID
+            progress: Progress percentage
+            status: Status dictionary as exposed by /operation_status
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            conn.execute("""
+                INSERT INTO operations (operation_id, progress, status_json, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(operation_id) DO UPDATE SET
+                    progress = excluded.progress,
+                    status_json = excluded.status_json,
+                    updated_at = excluded.updated_at
+            """, (operation_id, progress, json.dumps(status, default=str), time.time()))
+
+    def get_operation(self, operation_id: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get the persisted state of a background operation.
+
+        Args:
+            operation_id: Operation UUID
+
+        Returns:
+            Tuple of (progress, status dictionary) or None if unknown
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'SELECT progress, status_json FROM operations WHERE operation_id = ?',
+            (operation_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        try:
+            return row['progress'], json.loads(row['status_json'])
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse stored status for operation {operation_id}: {e}")
+            return None
+
+    def purge_operations(self, max_age_seconds: float) -> int:
+        """
+        Delete persisted operations that have not been updated recently.
+
+        Args:
+            max_age_seconds: Maximum age since the last update
+
+        Returns:
+            Number of deleted operations
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                'DELETE FROM operations WHERE updated_at < ?',
+                (time.time() - max_age_seconds,)
+            )
+        return cursor.rowcount
+
+    def init_generation_cache_table(self):
+        """
+        Create the generation_cache table holding stored OpenAI JSON results.
+
+        Safe to call repeatedly; callers create it on first use of the cache.
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS generation_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    result_json TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    def get_cached_generation(self, cache_key: str, max_age_seconds: float) -> Optional[str]:
+        """
+        Get a generation result stored within the last max_age_seconds.
+
+        Args:
+            cache_key: Hash of the model and prompts that produced the result
+            max_age_seconds: Oldest entry still considered valid
+
+        Returns:
+            The result as a JSON string, or None if nothing valid is stored
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        row = self.conn.execute(
+            'SELECT result_json FROM generation_cache WHERE cache_key = ? AND created_at > ?',
+            (cache_key, time.time() - max_age_seconds)
+        ).fetchone()
+        return row['result_json'] if row else None
+
+    def purge_generation_cache(self, max_age_seconds: float) -> int:
+        """
+        Delete stored generation results older than max_age_seconds.
+
+        Args:
+            max_age_seconds: Maximum age since the result was stored
+
+        Returns:
+            Number of deleted results
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                'DELETE FROM generation_cache WHERE created_at < ?',
+                (time.time() - max_age_seconds,)
+            )
+        return cursor.rowcount
+
+    def save_cached_generation(self, cache_key: str, result_json: str) -> None:
+        """
+        Store (or replace) a generation result.
+
+        Args:
+            cache_key: Hash of the model and prompts that produced the result
+            result_json: The result as a JSON string
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            conn.execute("""
+                INSERT INTO generation_cache (cache_key, result_json, created_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE
+                SET result_json = excluded.result_json,
+                    created_at = excluded.created_at
+            """, (cache_key, result_json, time.time()))
+
+    def init_job_details_cache_table(self):
+        """
+        Create the job_details_cache table holding recently fetched job details.
+
+        Safe to call repeatedly; callers create it on first use of the cache.
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_details_cache (
+                    job_url TEXT PRIMARY KEY,
+                    details_json TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+
+    def get_cached_job_details(self, job_url: str, max_age_seconds: float) -> Optional[str]:
+        """
+        Get job details fetched for a URL within the last max_age_seconds.
+
+        Args:
+            job_url: Job posting URL (will be normalized)
+            max_age_seconds: Oldest entry still considered fresh
+
+        Returns:
+            The details as a JSON string, or None if nothing fresh is stored
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        row = self.conn.execute(
+            'SELECT details_json FROM job_details_cache WHERE job_url = ? AND fetched_at > ?',
+            (self.url_normalizer.to_full_url(job_url), time.time() - max_age_seconds)
+        ).fetchone()
+        return row['details_json'] if row else None
+
+    def save_cached_job_details(self, job_url: str, details_json: str) -> None:
+        """
+        Store (or replace) the job details fetched for a URL.
+
+        Args:
+            job_url: Job posting URL (will be normalized)
+            details_json: The details as a JSON string
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        with self.transaction() as conn:
+            conn.execute("""
+                INSERT INTO job_details_cache (job_url, details_json, fetched_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(job_url) DO UPDATE
+                SET details_json = excluded.details_json,
+                    fetched_at = excluded.fetched_at
+            """, (self.url_normalizer.to_full_url(job_url), details_json, time.time()))
+
     def job_exists(self, job_url: str, search_term: str, cv_key: str) -> bool:
         """
         Check if a job match already exists in database.
@@ -279,52 +623,13 @@ class JobMatchDatabase:
         
         assert self.conn is not None, "Database connection not established"
         
-        # Normalize URL
-        match_data['job_url'] = self.url_normalizer.to_full_url(match_data['job_url'])
-        
-        # Convert scraped_data to JSON if it's a dict
-        if isinstance(match_data.get('scraped_data'), dict):
-            match_data['scraped_data'] = json.dumps(match_data['scraped_data'])
-        
-        # Ensure timestamps are in ISO format
-        if 'scraped_at' not in match_data:
-            match_data['scraped_at'] = datetime.now().isoformat()
-        
-        cursor = self.conn.cursor()
+        self._prepare_job_match(match_data)
         
         try:
-            cursor.execute("""
-                INSERT INTO job_matches (
-                    job_url, search_term, cv_key, job_title, company_name,
-                    location, posting_date, salary_range, overall_match,
-                    skills_match, experience_match, education_fit,
-                    career_trajectory_alignment, preference_match,
-                    potential_satisfaction, location_compatibility,
-                    reasoning, scraped_data, scraped_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                match_data['job_url'],
-                match_data['search_term'],
-                match_data['cv_key'],
-                match_data.get('job_title'),
-                match_data.get('company_name'),
-                match_data.get('location'),
-                match_data.get('posting_date'),
-                match_data.get('salary_range'),
-                match_data['overall_match'],
-                match_data.get('skills_match'),
-                match_data.get('experience_match'),
-                match_data.get('education_fit'),
-                match_data.get('career_trajectory_alignment'),
-                match_data.get('preference_match'),
-                match_data.get('potential_satisfaction'),
-                match_data.get('location_compatibility'),
-                match_data.get('reasoning'),
-                match_data['scraped_data'],
-                match_data['scraped_at']
-            ))
+            # transaction() rolls back on failure, so no write lock is left behind
+            with self.transaction() as conn:
+                cursor = conn.execute(self.INSERT_JOB_MATCH_SQL, self._job_match_params(match_data))
             
-            self.conn.commit()
             logger.debug(f"Inserted job match: {match_data['job_url']}")
             return cursor.lastrowid
             
@@ -337,6 +642,69 @@ class JobMatchDatabase:
             logger.error(f"Database operational error: {e}")
             raise
     
+    def insert_job_matches(self, match_list: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Insert several job match records in a single transaction.
+        
+        Args:
+            match_list: List of job match dictionaries (same shape as insert_job_match)
+            
+        Returns:
+            Row ID per input record, in order; None where the record was a duplicate
+            
+        Raises:
+            sqlite3.Error: If the transaction fails (nothing from the batch is kept)
+        """
+        if not match_list:
+            return []
+        
+        row_ids: List[Optional[int]] = []
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            for match_data in match_list:
+                self._prepare_job_match(match_data)
+                cursor.execute(self.INSERT_JOB_MATCH_OR_IGNORE_SQL, self._job_match_params(match_data))
+                row_ids.append(cursor.lastrowid if cursor.rowcount == 1 else None)
+        
+        logger.debug(f"Inserted {sum(1 for row_id in row_ids if row_id is not None)}/{len(match_list)} job matches")
+        return row_ids
+    
+    def _prepare_job_match(self, match_data: Dict[str, Any]) -> None:
+        """
+        Normalize a job match record in place before it is inserted.
+        
+        Args:
+            match_data: Dictionary containing job match data
+        """
+        # Normalize URL
+        match_data['job_url'] = self.url_normalizer.to_full_url(match_data['job_url'])
+        
+        # Convert scraped_data to JSON if it's a dict
+        if isinstance(match_data.get('scraped_data'), dict):
+            match_data['scraped_data'] = json.dumps(match_data['scraped_data'])
+        
+        # Ensure timestamps are in ISO format
+        if 'scraped_at' not in match_data:
+            match_data['scraped_at'] = datetime.now().isoformat()
+    
+    def _job_match_params(self, match_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Build the parameter tuple for INSERT_JOB_MATCH_SQL.
+        
+        Args:
+            match_data: Prepared job match data (URL normalized, scraped_data serialized)
+            
+        Returns:
+            Values in JOB_MATCH_COLUMNS order
+            
+        Raises:
+            KeyError: If a required column is missing
+        """
+        for required in ('job_url', 'search_term', 'cv_key', 'overall_match', 'scraped_data', 'scraped_at'):
+            if required not in match_data:
+                raise KeyError(required)
+        return tuple(match_data.get(column) for column in self.JOB_MATCH_COLUMNS)
+    
     def insert_scrape_history(self, history_data: Dict[str, Any]) -> int:
         """
         Insert scrape history record.
@@ -355,24 +723,22 @@ class JobMatchDatabase:
         if 'scraped_at' not in history_data:
             history_data['scraped_at'] = datetime.now().isoformat()
         
-        cursor = self.conn.cursor()
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO scrape_history (
+                    search_term, page_number, jobs_found, new_jobs,
+                    duplicate_jobs, scraped_at, duration_seconds
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                history_data['search_term'],
+                history_data['page_number'],
+                history_data['jobs_found'],
+                history_data['new_jobs'],
+                history_data['duplicate_jobs'],
+                history_data['scraped_at'],
+                history_data.get('duration_seconds')
+            ))
         
-        cursor.execute("""
-            INSERT INTO scrape_history (
-                search_term, page_number, jobs_found, new_jobs,
-                duplicate_jobs, scraped_at, duration_seconds
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            history_data['search_term'],
-            history_data['page_number'],
-            history_data['jobs_found'],
-            history_data['new_jobs'],
-            history_data['duplicate_jobs'],
-            history_data['scraped_at'],
-            history_data.get('duration_seconds')
-        ))
-        
-        self.conn.commit()
         row_id = cursor.lastrowid
         assert row_id is not None, "Failed to get inserted row ID"
         return row_id
@@ -494,6 +860,36 @@ class JobMatchDatabase:
         
         return None
     
+    def get_job_title(self, job_url: str) -> Optional[str]:
+        """
+        Get the stored job title for a job URL from any CV's match.
+
+        Uses the job_url prefix of the UNIQUE(job_url, search_term, cv_key)
+        index, so it is a cheap alternative to re-scraping the posting.
+
+        Args:
+            job_url: Job posting URL (will be normalized)
+
+        Returns:
+            Job title or None if the URL has not been matched yet
+        """
+        if not self.conn:
+            self.connect()
+
+        assert self.conn is not None, "Database connection not established"
+
+        normalized_url = self.url_normalizer.to_full_url(job_url)
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT job_title FROM job_matches
+            WHERE job_url = ? AND job_title IS NOT NULL AND job_title != ''
+            LIMIT 1
+        """, (normalized_url,))
+
+        row = cursor.fetchone()
+        return row['job_title'] if row else None
+
     def get_jobs_by_cv_key(self, cv_key: str, search_term: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve jobs for a specific CV key, optionally filtered by search term.
@@ -524,7 +920,8 @@ class JobMatchDatabase:
         query += " ORDER BY overall_match DESC"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(limit)
         
         cursor = self.conn.cursor()
         cursor.execute(query, params)
@@ -589,41 +986,110 @@ class JobMatchDatabase:
             self.connect()
         
         assert self.conn is not None, "Database connection not established"
-        cursor = self.conn.cursor()
         
         try:
-            # Check if record exists
-            cursor.execute(
-                'SELECT id FROM applications WHERE job_match_id = ?',
-                (job_match_id,)
-            )
-            exists = cursor.fetchone()
+            # The existence check runs inside the write transaction, so no other
+            # writer can insert the record between the check and the write
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                # Check if record exists
+                cursor.execute(
+                    'SELECT id FROM applications WHERE job_match_id = ?',
+                    (job_match_id,)
+                )
+                exists = cursor.fetchone()
+                
+                if exists:
+                    # Update existing record
+                    cursor.execute('''
+                        UPDATE applications 
+                        SET status = ?, 
+                            updated_at = CURRENT_TIMESTAMP,
+                            notes = COALESCE(?, notes)
+                        WHERE job_match_id = ?
+                    ''', (new_status, notes, job_match_id))
+                    logger.info(f"Updated status for job_match_id {job_match_id} to {new_status}")
+                else:
+                    # Insert new record
+                    cursor.execute('''
+                        INSERT INTO applications (job_match_id, status, notes)
+                        VALUES (?, ?, ?)
+                    ''', (job_match_id, new_status, notes))
+                    logger.info(f"Created application for job_match_id {job_match_id} with status {new_status}")
             
-            if exists:
-                # Update existing record
-                cursor.execute('''
-                    UPDATE applications 
-                    SET status = ?, 
-                        updated_at = CURRENT_TIMESTAMP,
-                        notes = COALESCE(?, notes)
-                    WHERE job_match_id = ?
-                ''', (new_status, notes, job_match_id))
-                logger.info(f"Updated status for job_match_id {job_match_id} to {new_status}")
-            else:
-                # Insert new record
-                cursor.execute('''
-                    INSERT INTO applications (job_match_id, status, notes)
-                    VALUES (?, ?, ?)
-                ''', (job_match_id, new_status, notes))
-                logger.info(f"Created application for job_match_id {job_match_id} with status {new_status}")
-            
-            self.conn.commit()
             return True
             
         except sqlite3.Error as e:
             logger.error(f"Database error updating application status: {e}")
             return False
 
+    def promote_application_statuses(
+        self,
+        job_urls: List[str],
+        cv_key: str,
+        new_status: str,
+        from_statuses: Tuple[str, ...] = (
+            ApplicationStatus.MATCHED.value,
+            ApplicationStatus.INTERESTED.value,
+        ),
+    ) -> int:
+        """
+        Move the applications for several job URLs to a new status in one transaction.
+
+        Jobs without an application record are treated as MATCHED and get one
+        created; existing records are only updated while their status is in
+        from_statuses. All rows are written with a single executemany.
+
+        Args:
+            job_urls: Job posting URLs (will be normalized)
+            cv_key: CV version key the matches belong to
+            new_status: New status string
+            from_statuses: Statuses that may be promoted
+
+        Returns:
+            Number of application rows created or updated
+        """
+        if not ApplicationStatus.is_valid(new_status):
+            logger.error(f"Invalid status: {new_status}")
+            return 0
+
+        if not job_urls:
+            return 0
+
+        params = [
+            (new_status, self.url_normalizer.to_full_url(url), cv_key, *from_statuses)
+            for url in job_urls
+        ]
+
+        try:
+            with self.transaction() as conn:
+                cursor = conn.executemany(self._promote_applications_sql(len(from_statuses)), params)
+            logger.info(f"Promoted {cursor.rowcount} application(s) to {new_status} for cv_key {cv_key}")
+            return cursor.rowcount
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error promoting application statuses: {e}")
+            return 0
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _promote_applications_sql(cls, status_count: int) -> str:
+        """
+        Build the promote upsert for a given number of from_statuses.
+        
+        Cached so every call with the same shape hands SQLite identical SQL text,
+        which its statement cache can reuse.
+        
+        Args:
+            status_count: Number of statuses in the IN (...) clause
+            
+        Returns:
+            SQL text
+        """
+        return cls.PROMOTE_APPLICATIONS_SQL_TEMPLATE.format(
+            status_placeholders=', '.join('?' for _ in range(status_count))
+        )
+    
     def add_application_note(self, job_match_id: int, note: str) -> bool:
         """
         Add or append a note to an application.
@@ -641,18 +1107,17 @@ class JobMatchDatabase:
         assert self.conn is not None, "Database connection not established"
         
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                UPDATE applications 
-                SET notes = CASE 
-                    WHEN notes IS NULL THEN ?
-                    ELSE notes || '\n' || ?
-                END,
-                updated_at = CURRENT_TIMESTAMP
-                WHERE job_match_id = ?
-            ''', (note, note, job_match_id))
-            
-            self.conn.commit()
+            with self.transaction() as conn:
+                cursor = conn.execute('''
+                    UPDATE applications 
+                    SET notes = CASE 
+                        WHEN notes IS NULL THEN ?
+                        ELSE notes || '\n' || ?
+                    END,
+                    updated_at = CURRENT_TIMESTAMP
+                    WHERE job_match_id = ?
+                ''', (note, note, job_match_id))
+            
             return cursor.rowcount > 0
             
         except sqlite3.Error as e:
@@ -686,3 +1151,37 @@ class JobMatchDatabase:
         if result:
             return dict(result)
         return None
+
+
+# One long-lived JobMatchDatabase per thread (and per db_path), so request and
+# worker threads reuse their connection instead of opening one per call
+_thread_local = threading.local()
+
+
+def get_thread_database(db_path: str = "instance/jobsearchai.db") -> JobMatchDatabase:
+    """
+    Get the calling thread's shared JobMatchDatabase, connecting on first use.
+    
+    The connection lives as long as the thread; callers must not close() it.
+    A transaction left open by an earlier failed write is rolled back before the
+    connection is handed out, so it can't hold the write lock indefinitely.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        Connected JobMatchDatabase instance
+    """
+    databases = getattr(_thread_local, 'databases', None)
+    if databases is None:
+        databases = _thread_local.databases = {}
+    
+    db = databases.get(db_path)
+    if db is None:
+        db = databases[db_path] = JobMatchDatabase(db_path)
+    if not db.conn:
+        db.connect()
+    elif db.conn.in_transaction:
+        logger.warning(f"Rolling back a transaction left open on this thread's connection to {db_path}")
+        db.conn.rollback()
+    return db
@@ -221,6 +221,9 @@ def cache_result(max_size: int = 128, ttl: Optional[float] = None) -> Callable[[
     """
     Simple in-memory cache decorator.
     
+    Callers can pass refresh_cache=True to skip the lookup and replace the
+    stored entry with a fresh result; the flag is not passed on to the function.
+    
     Args:
         max_size: Maximum number of items to cache
         ttl: Time-to-live in seconds. If None, cache entries never expire
@@ -242,6 +245,8 @@ def cache_result(max_size: int = 128, ttl: Optional[float] = None) -> Callable[[
         
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            refresh = kwargs.pop('refresh_cache', False)
+            
             # Create a cache key from the function arguments
             key_parts = [func.__name__]
             key_parts.extend([str(arg) for arg in args])
@@ -252,7 +257,7 @@ def cache_result(max_size: int = 128, ttl: Optional[float] = None) -> Callable[[
             current_time = time.time()
             
             # Check if result is in cache and not expired
-            if key in cache:
+            if key in cache and not refresh:
                 result, timestamp = cache[key]
                 
                 # Check if entry is expired
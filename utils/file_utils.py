@@ -6,6 +6,9 @@ leveraging the centralized configuration for consistent path resolution.
 """
 
 import json
+import os
+import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, cast
@@ -13,6 +16,12 @@ from typing import Any, Dict, List, Optional, Union, cast
 # Import the configuration module
 from config import config
 
+# orjson is optional: it parses/serializes several times faster than the stdlib codec
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging using centralized configuration
 from utils.logging_config import get_logger
 logger = get_logger("file_utils")
@@ -60,6 +69,28 @@ def get_latest_file(
     # Return the most recent file
     return max(matching_files, key=lambda x: x.stat().st_mtime)
 
+def read_json(file_path: Union[str, Path]) -> Any:
+    """
+    Parse a UTF-8 JSON file, using orjson when it is installed.
+    
+    Unlike load_json_file, errors are raised so callers can report them.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(Path(file_path).read_bytes())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_json_file(
     file_path: Union[str, Path],
     default: Any = None,
@@ -98,6 +129,8 @@ def load_json_file(
     
     # Load JSON
     try:
+        if encoding.lower() in ('utf-8', 'utf8'):
+            return read_json(path)
         with open(path, 'r', encoding=encoding) as f:
             return json.load(f)
     except json.JSONDecodeError as e:
@@ -111,8 +144,9 @@ def save_json_file(
     data: Any,
     file_path: Union[str, Path],
     encoding: str = 'utf-8',
-    indent: int = 2,
-    ensure_ascii: bool = False
+    indent: Optional[int] = 2,
+    ensure_ascii: bool = False,
+    create_dirs: bool = True
 ) -> bool:
     """
     Save data to a JSON file with error handling.
@@ -121,8 +155,10 @@ def save_json_file(
         data: Data to save
         file_path: Path to the JSON file
         encoding: File encoding
-        indent: JSON indentation level
+        indent: JSON indentation level; None writes compact JSON for files only code reads
         ensure_ascii: Whether to escape non-ASCII characters
+        create_dirs: Create missing parent directories; callers writing many
+            files into a directory they already created can skip the mkdir
         
     Returns:
         True if saving succeeded, False otherwise
@@ -143,18 +179,63 @@ def save_json_file(
         path = file_path
     
     # Create parent directories if they don't exist
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if create_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
     
     # Save JSON
     try:
-        with open(path, 'w', encoding=encoding) as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        payload = None
+        if orjson is not None and indent in (2, None) and not ensure_ascii and encoding.lower() in ('utf-8', 'utf8'):
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+            try:
+                payload = orjson.dumps(data, option=option)
+            except TypeError as e:
+                # orjson rejects some types the stdlib encoder accepts (e.g. subclassed ints as keys)
+                logger.debug(f"orjson could not serialize data for {path}, falling back to json: {e}")
+        if payload is None:
+            separators = (',', ':') if indent is None else None
+            payload = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, separators=separators).encode(encoding)
+        atomic_write_bytes(path, payload)
         logger.info(f"Saved JSON data to {path}")
         return True
     except Exception as e:
         logger.error(f"Error saving JSON to {path}: {e}")
         return False
 
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """
+    Replace the contents of a file in one step.
+    
+    The data goes to a temporary file in the same directory, which is then
+    renamed over the target, so readers never see a half-written file and a
+    crash mid-write leaves the previous version intact. The data is fsynced
+    before the rename, so a power loss can't leave an empty file behind it.
+    
+    Args:
+        path: Destination file
+        payload: Complete new file contents
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            # One fsync per write: the data must be on disk before the rename is
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; keep the permissions a plain open() would give
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def flatten_nested_job_data(job_data: Any) -> List[Dict[str, Any]]:
     """
     Flatten nested job data structures into a simple list of job listings.
@@ -326,10 +407,35 @@ def load_text_file(
         return default
 
 
+# Anything but letters, digits, underscore and hyphen (same set as str.isalnum() plus '_-')
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w-]')
+
+def sanitize_filename(name: str, length: int = 30) -> str:
+    """
+    Turn a job title into the stem used for motivation letter file names.
+    
+    Every character other than letters, digits, '_' and '-' (spaces included)
+    becomes '_', and the result is cut to length characters.
+    
+    Args:
+        name: String to sanitize
+        length: Maximum length of output (default: 30)
+    
+    Returns:
+        Sanitized string
+    """
+    return _UNSAFE_FILENAME_CHARS.sub('_', name)[:length]
+
+
 # ============================================================================
 # CHECKPOINT INFRASTRUCTURE FUNCTIONS
 # ============================================================================
 
+# Path separators and characters Windows forbids become '_'; other non-word characters are dropped
+_FOLDER_REPLACED_CHARS = re.compile(r'[/\\:*?"<>|]')
+_FOLDER_DROPPED_CHARS = re.compile(r'[^\w -]')
+_REPEATED_UNDERSCORES = re.compile(r'_{2,}')
+
 def sanitize_folder_name(name: str, max_length: int = 50) -> str:
     """
     Sanitize a string to be safe for folder names.
@@ -352,20 +458,12 @@ def sanitize_folder_name(name: str, max_length: int = 50) -> str:
         return "unknown"
     
     # Remove/replace unsafe characters
-    safe_chars = []
-    for c in name:
-        if c.isalnum() or c in [' ', '-', '_']:
-            safe_chars.append(c)
-        elif c in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']:
-            safe_chars.append('_')
-    
-    # Join and clean up
-    safe_name = ''.join(safe_chars)
+    safe_name = _FOLDER_REPLACED_CHARS.sub('_', name)
+    safe_name = _FOLDER_DROPPED_CHARS.sub('', safe_name)
     safe_name = safe_name.replace(' ', '_')
     
     # Remove multiple consecutive underscores
-    while '__' in safe_name:
-        safe_name = safe_name.replace('__', '_')
+    safe_name = _REPEATED_UNDERSCORES.sub('_', safe_name)
     
     # Trim to max length
     safe_name = safe_name[:max_length]
@@ -436,7 +534,8 @@ def create_application_folder(
 def create_metadata_file(
     folder_path: Path, 
     job_details: Dict[str, Any], 
-    cv_filename: Optional[str] = None
+    cv_filename: Optional[str] = None,
+    timestamp: Optional[str] = None
 ) -> None:
     """
     Create metadata.json file in checkpoint folder.
@@ -448,6 +547,7 @@ def create_metadata_file(
         folder_path: Path to application folder
         job_details: Dictionary with job information
         cv_filename: Name of CV file (default: 'Lebenslauf.pdf')
+        timestamp: ISO generation time; taken now when not given
     
     Example:
         create_metadata_file(
@@ -464,7 +564,7 @@ def create_metadata_file(
         "id": app_id,
         "company": job_details.get('Company Name', ''),
         "job_title": job_details.get('Job Title', ''),
-        "date_generated": datetime.now().isoformat(),
+        "date_generated": timestamp or datetime.now().isoformat(),
         "application_url": job_details.get('Application URL', ''),
         "application_email": job_details.get('Email', ''),
         "contact_name": job_details.get('Contact Person', ''),
@@ -474,13 +574,12 @@ def create_metadata_file(
     }
     
     metadata_path = folder_path / 'metadata.json'
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    atomic_write_bytes(metadata_path, json.dumps(metadata, indent=2, ensure_ascii=False).encode('utf-8'))
     
     logger.info(f"✅ Created metadata.json: {metadata_path}")
 
 
-def create_status_file(folder_path: Path) -> None:
+def create_status_file(folder_path: Path, timestamp: Optional[str] = None) -> None:
     """
     Create initial status.json file in checkpoint folder.
     
@@ -498,6 +597,7 @@ def create_status_file(folder_path: Path) -> None:
     
     Args:
         folder_path: Path to application folder
+        timestamp: ISO time for last_updated; taken now when not given
     
     Example:
         create_status_file(Path('applications/001_Company_Job'))
@@ -505,22 +605,43 @@ def create_status_file(folder_path: Path) -> None:
     status = {
         "status": "draft",
         "sent_date": None,
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": timestamp or datetime.now().isoformat(),
         "notes": "",
         "response_received": False,
         "interview_scheduled": None
     }
     
     status_path = folder_path / 'status.json'
-    with open(status_path, 'w', encoding='utf-8') as f:
-        json.dump(status, f, indent=2, ensure_ascii=False)
+    atomic_write_bytes(status_path, json.dumps(status, indent=2, ensure_ascii=False).encode('utf-8'))
     
     logger.info(f"✅ Created status.json: {status_path}")
 
 
+def find_latest_cv_pdf(cv_source_dir: str = 'process_cv/cv-data/input') -> Optional[Path]:
+    """
+    Find the most recently modified CV PDF (assumes one CV per user).
+    
+    Args:
+        cv_source_dir: Directory where CV PDFs are stored
+                      (default: 'process_cv/cv-data/input')
+    
+    Returns:
+        Path to the newest PDF, or None if the directory holds none
+    """
+    cv_dir = Path(cv_source_dir)
+    pdf_files = list(cv_dir.glob('*.pdf'))
+    
+    if not pdf_files:
+        logger.warning(f"⚠️ No CV PDF found in {cv_dir}")
+        return None
+    
+    return max(pdf_files, key=lambda p: p.stat().st_mtime)
+
+
 def copy_cv_to_folder(
     folder_path: Path, 
-    cv_source_dir: str = 'process_cv/cv-data/input'
+    cv_source_dir: str = 'process_cv/cv-data/input',
+    cv_pdf: Optional[Path] = None
 ) -> None:
     """
     Copy CV PDF to application folder with standardized name.
@@ -533,24 +654,18 @@ def copy_cv_to_folder(
         folder_path: Path to application folder
         cv_source_dir: Directory where CV PDFs are stored
                       (default: 'process_cv/cv-data/input')
+        cv_pdf: CV PDF already resolved by the caller (e.g. once per
+                bulk request); skips the directory scan when given
     
     Example:
         copy_cv_to_folder(Path('applications/001_Company_Job'))
     """
     import shutil
     
-    cv_dir = Path(cv_source_dir)
-    
-    # Find the most recent PDF (assumes one CV per user)
-    pdf_files = list(cv_dir.glob('*.pdf'))
-    
-    if not pdf_files:
-        logger.warning(f"⚠️ No CV PDF found in {cv_dir}")
+    most_recent_pdf = cv_pdf or find_latest_cv_pdf(cv_source_dir)
+    if not most_recent_pdf:
         return
     
-    # Get most recent PDF by modification time
-    most_recent_pdf = max(pdf_files, key=lambda p: p.stat().st_mtime)
-    
     # Copy to application folder with standard name
     dest_path = folder_path / 'lebenslauf.pdf'
     shutil.copy2(most_recent_pdf, dest_path)
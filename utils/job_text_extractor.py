@@ -5,6 +5,7 @@ This module provides LLM-based extraction of job posting details from raw text,
 using Pydantic models for validation and Instructor for structured output.
 """
 
+import functools
 from typing import Optional, Dict, Any
 
 import instructor
@@ -142,6 +143,12 @@ class JobPosting(BaseModel):
         return self
 
 
+@functools.lru_cache(maxsize=1)
+def _get_instructor_client(api_key: str):
+    """Return the Instructor-wrapped OpenAI client for api_key, created once and reused."""
+    return instructor.from_openai(OpenAI(api_key=api_key))
+
+
 def extract_job_from_text(
     raw_text: str,
     source_url: Optional[str] = None,
@@ -174,8 +181,8 @@ def extract_job_from_text(
     logger.info(f"Extracting job details from text ({len(raw_text)} chars) using model: {model}")
 
     try:
-        # Create Instructor client
-        client = instructor.from_openai(OpenAI(api_key=api_key))
+        # Shared Instructor client (reuses the HTTP connection pool across extractions)
+        client = _get_instructor_client(api_key)
 
         # Extract structured data
         job = client.chat.completions.create(
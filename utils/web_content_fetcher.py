@@ -8,6 +8,7 @@ Uses multiple strategies with automatic fallback:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple
 from urllib.parse import quote
 
@@ -22,6 +23,22 @@ JINA_READER_BASE = "https://r.jina.ai/"
 DEFAULT_TIMEOUT = 30
 JINA_TIMEOUT = 60  # Jina may take longer for complex pages
 
+# Connection pool size per host, sized for the bulk generation worker pool
+HTTP_POOL_SIZE = 32
+
+
+def _create_http_session() -> requests.Session:
+    """Create the shared session so TCP/TLS connections are reused across fetches and threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by every fetch in the process (bulk workers included)
+http_session = _create_http_session()
+
 
 def fetch_with_jina_reader(url: str, timeout: int = JINA_TIMEOUT) -> Optional[str]:
     """
@@ -50,7 +67,7 @@ def fetch_with_jina_reader(url: str, timeout: int = JINA_TIMEOUT) -> Optional[st
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-        response = requests.get(jina_url, headers=headers, timeout=timeout)
+        response = http_session.get(jina_url, headers=headers, timeout=timeout)
         response.raise_for_status()
 
         content = response.text
@@ -159,7 +176,7 @@ def fetch_with_requests(url: str, timeout: int = DEFAULT_TIMEOUT) -> Optional[st
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
         }
 
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = http_session.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
 
         from bs4 import BeautifulSoup
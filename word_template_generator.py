@@ -1,7 +1,7 @@
 import os
-import json
 from pathlib import Path
 from utils.warning_utils import SuppressWarnings
+from utils.file_utils import read_json
 
 # Import docxtpl with suppressed pkg_resources warnings
 with SuppressWarnings(['pkg_resources']):
@@ -63,8 +63,7 @@ def json_to_docx(motivation_letter_json, template_path='motivation_letters/templ
 def create_word_document_from_json_file(json_file_path, template_path='motivation_letters/template/motivation_letter_template.docx'):
     """Load JSON file and generate Word document using the template."""
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            motivation_letter_json = json.load(f)
+        motivation_letter_json = read_json(json_file_path)
         output_path = json_file_path.replace('.json', '.docx')
         return json_to_docx(motivation_letter_json, template_path=template_path, output_path=output_path)
     except Exception as e: